@@ -1,13 +1,90 @@
+import functools
+import json
 import logging
+import os
+import threading
 import time
-from datetime import datetime, time as dt_time, timedelta
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
 
-import pytz
+import numpy as np
+import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from alpaca_trade_api import REST
 from alpaca_trade_api.common import URL
 from alpaca.trading.client import TradingClient
 
+from utils import DATA_DIR, ensure_directories
+
+# Signal polling fans out one thread per watchlist symbol; size the pool so
+# concurrent calls reuse warm keep-alive connections instead of discarding them.
+HTTP_POOL_MAXSIZE = 16
+
+# Transient Alpaca responses retried with exponential backoff (overridable via
+# alpaca.retry in config.yaml). Only idempotent methods are retried, so order
+# submissions are never replayed.
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF_SECONDS = 0.2
+DEFAULT_RETRY_STATUS_CODES = (429, 503, 504)
+
+# zoneinfo is cheaper than pytz and needs no localize() step
+EASTERN_TZ = ZoneInfo('US/Eastern')
+UTC = timezone.utc
+MARKET_OPEN_MINUTE = 9 * 60 + 30
+
+# Option expirations change at most once a day, so chains are cached briefly;
+# empty chains (unknown/untradeable tickers) are remembered for longer.
+OPTION_CHAIN_TTL_SECONDS = 300
+EMPTY_OPTION_CHAIN_TTL_SECONDS = 1800
+# Calendar days of expirations fetched when no expiration is given
+OPTION_CHAIN_DAYS = 5
+OPTION_CONTRACTS_PAGE_LIMIT = 1000
+
+NEWS_FIELDS = ("headline", "summary", "author", "created_at", "url", "symbols")
+
+# Previous closes are constant for a trading day; persisted so restarts skip the fetch
+PREV_CLOSE_CACHE_FILE = DATA_DIR / "prev_close_cache.json"
+
+# Completed daily bars never change, so each symbol's history is kept on disk
+# and only the days since the last cached session are requested.
+DAILY_BARS_CACHE_DIR = DATA_DIR / "cache" / "daily_bars"
+DAILY_BARS_MAX_CACHED = 400
+
+
+def _log_failure(action: str):
+    """Log a failed broker call and re-raise; retries happen in the HTTP session."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as exc:
+                target = f" for {args[0]}" if args else ""
+                self.logger.error("Failed to %s%s: %s", action, target, exc)
+                raise
+        return wrapper
+    return decorator
+
+
+class OptionContract(NamedTuple):
+    """Option-chain record; much lighter than a dict per contract.
+
+    ``get`` keeps the dict-style ``option.get("strike_price")`` callers working.
+    """
+
+    symbol: str
+    strike_price: float
+    option_type: str
+    expiration_date: str
+    open_interest: int
+    size: int
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._fields else default
+
 
 class BrokerClient:
     """Wrapper around Alpaca REST API supporting paper/live modes."""
@@ -28,25 +105,74 @@ class BrokerClient:
         if not self.api_key_id or not self.api_secret_key:
             raise ValueError("Alpaca API keys must be provided in config.yaml")
 
+        retry_cfg = alpaca_cfg.get("retry", {})
+        self._retry = Retry(
+            total=retry_cfg.get("max_attempts", DEFAULT_RETRY_ATTEMPTS),
+            backoff_factor=retry_cfg.get("backoff_seconds", DEFAULT_RETRY_BACKOFF_SECONDS),
+            status_forcelist=retry_cfg.get("status_codes", DEFAULT_RETRY_STATUS_CODES),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
         # Old SDK for market data
         self.client = REST(self.api_key_id, self.api_secret_key, self.base_url, api_version="v2")
-        
-        # New SDK for options data
-        self.trading_client = TradingClient(
-            self.api_key_id, 
-            self.api_secret_key, 
-            paper=(self.mode == "paper")
-        )
+        self._tune_session(self.client._session, self._retry)
+        # Backoff lives in the session adapter; the SDK's fixed-wait loop would double it
+        self.client._retry = 0
+
+        # New SDK for options data, created on first use (see trading_client)
+        self._trading_client: Optional[TradingClient] = None
+
+        self._chain_cache: Dict[Tuple[str, str], Tuple[float, List[OptionContract]]] = {}
+        self._prev_close_day: Optional[str] = None
+        self._prev_close_cache: Dict[str, float] = {}
+        self._prev_close_lock = threading.Lock()
+
+    @property
+    def trading_client(self) -> TradingClient:
+        """alpaca-py client used for option contracts.
+
+        Built lazily and pointed at the legacy client's session: both SDKs send
+        auth headers per request, so one connection pool serves both.
+        """
+        if self._trading_client is None:
+            trading_client = TradingClient(
+                self.api_key_id,
+                self.api_secret_key,
+                paper=(self.mode == "paper")
+            )
+            trading_client._session.close()
+            trading_client._session = self.client._session
+            trading_client._retry = 0
+            self._trading_client = trading_client
+        return self._trading_client
+
+    @trading_client.setter
+    def trading_client(self, value: TradingClient) -> None:
+        self._trading_client = value
+
+    @staticmethod
+    def _tune_session(session: Any, retry: Optional[Retry] = None) -> None:
+        """Mount a larger keep-alive pool, with backoff retries, on an SDK session.
+
+        urllib3 already sets TCP_NODELAY and requests already asks for gzip, so
+        pool size and retry policy are the only defaults worth changing.
+        """
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry or 0)
+        session.mount("https://", adapter)
 
     # -------------------- Market Data --------------------
+    @_log_failure("fetch latest bar")
     def get_latest_bar(self, symbol: str) -> Dict[str, Any]:
         """Get the latest price bar for a symbol."""
-        try:
-            bar = self.client.get_latest_bar(symbol, feed=self.data_feed)
-            return bar._raw if hasattr(bar, '_raw') else bar.to_dict()
-        except Exception as exc:
-            self.logger.error("Failed to fetch latest bar for %s: %s", symbol, exc)
-            raise
+        bar = self.client.get_latest_bar(symbol, feed=self.data_feed)
+        return bar._raw if hasattr(bar, '_raw') else bar.to_dict()
+
+    @_log_failure("fetch latest bars")
+    def get_latest_bars_multi(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the latest price bar for several symbols in one request."""
+        bars = self.client.get_latest_bars(symbols, feed=self.data_feed)
+        return {symbol: bar._raw for symbol, bar in bars.items()}
 
     def get_historical_bars(
         self,
@@ -56,35 +182,70 @@ class BrokerClient:
         end: Optional[datetime] = None,
         limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
+        start_str, end_str = self._format_bar_range(start, end)
+        # raw=True pages through the response as plain dicts, skipping Bar entities
+        return list(self.client.get_bars_iter(
+            symbol,
+            timeframe,
+            start=start_str,
+            end=end_str,
+            limit=limit,
+            adjustment="raw",
+            feed=self.data_feed,
+            raw=True,
+        ))
+
+    def get_historical_bars_multi(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        start: datetime,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch bars for several symbols with one multi-symbol request.
+
+        Alpaca applies ``limit`` to the combined response, so it is enforced
+        per symbol here (keeping the most recent bars) instead.
+        """
+        start_str, end_str = self._format_bar_range(start, end)
+        bars = self.client.get_bars_iter(
+            symbols,
+            timeframe,
+            start=start_str,
+            end=end_str,
+            adjustment="raw",
+            feed=self.data_feed,
+            raw=True,
+        )
+        bars_by_symbol: Dict[str, List[Dict[str, Any]]] = {symbol: [] for symbol in symbols}
+        for bar in bars:
+            bars_by_symbol.setdefault(bar.get("S"), []).append(bar)
+        if limit:
+            for symbol, symbol_bars in bars_by_symbol.items():
+                bars_by_symbol[symbol] = symbol_bars[-limit:]
+        return bars_by_symbol
+
+    @staticmethod
+    def _format_bar_range(start: Any, end: Any) -> tuple:
         # Convert datetime to ISO format string for Alpaca API (without microseconds)
         if isinstance(start, datetime):
             start_str = start.replace(microsecond=0).isoformat()
         else:
             start_str = start
-            
+
         if isinstance(end, datetime) and end:
             end_str = end.replace(microsecond=0).isoformat()
         else:
             end_str = None
-        
-        bars = self.client.get_bars(
-            symbol,
-            timeframe,
-            start=start_str,
-            end=end_str,
-            limit=limit,
-            adjustment="raw",
-            feed=self.data_feed,
-        )
-        return [bar._raw for bar in bars]
+        return start_str, end_str
 
     def get_premarket_volume(self, symbol: str, date: datetime) -> float:
         """Calculate premarket volume (before 9:30 AM ET)."""
-        eastern = pytz.timezone('US/Eastern')
         if date.tzinfo is None:
-            date = eastern.localize(date)
+            date = date.replace(tzinfo=EASTERN_TZ)
         else:
-            date = date.astimezone(eastern)
+            date = date.astimezone(EASTERN_TZ)
         
         # Premarket typically starts at 4:00 AM ET
         start = date.replace(hour=4, minute=0, second=0, microsecond=0)
@@ -96,121 +257,217 @@ class BrokerClient:
             if not bars:
                 return 0.0
             
-            premarket_volume = 0.0
-            market_open_time = dt_time(9, 30)
-            
-            for bar in bars:
-                bar_time = bar.get("t")
-                if isinstance(bar_time, str):
-                    bar_time = datetime.fromisoformat(bar_time.replace('Z', '+00:00'))
-                if bar_time.tzinfo is None:
-                    bar_time = pytz.utc.localize(bar_time)
-                bar_time_et = bar_time.astimezone(eastern)
-                
-                if bar_time_et.time() < market_open_time:
-                    premarket_volume += float(bar.get("v", 0))
-            
-            return premarket_volume
+            # Pull the two columns out once; no DataFrame needed for a masked sum
+            bar_times = pd.DatetimeIndex(
+                pd.to_datetime([bar["t"] for bar in bars], utc=True, format="ISO8601")
+            ).tz_convert(EASTERN_TZ)
+            volumes = np.fromiter((bar["v"] for bar in bars), dtype=np.float64, count=len(bars))
+            mask = (bar_times.hour * 60 + bar_times.minute) < MARKET_OPEN_MINUTE
+            return float(volumes[np.asarray(mask)].sum())
         except Exception as exc:
             self.logger.warning("Failed to fetch premarket volume for %s: %s", symbol, exc)
             return 0.0
 
+    def get_daily_bars(self, symbol: str, lookback_days: int) -> List[Dict[str, Any]]:
+        """Daily bars for the last ``lookback_days`` calendar days, oldest first.
+
+        Completed sessions come from the on-disk cache; today's (possibly still
+        forming) bar is always fetched fresh and never cached.
+        """
+        today = datetime.now(EASTERN_TZ).date()
+        window_start = (today - timedelta(days=lookback_days)).isoformat()
+        today_str = today.isoformat()
+        cache_file = DAILY_BARS_CACHE_DIR / f"{symbol}.json"
+
+        history: List[Dict[str, Any]] = []
+        covered_from = None
+        try:
+            with cache_file.open("r", encoding="utf-8") as f:
+                stored = json.load(f)
+            history = stored.get("bars", [])
+            covered_from = stored.get("covered_from")
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        refetch = covered_from is None or covered_from > window_start
+        if refetch:
+            # Cache does not reach back far enough: fetch the whole window
+            history = []
+            covered_from = window_start
+            fetch_from = window_start
+        elif history:
+            last_day = datetime.fromisoformat(history[-1]["t"][:10]).date()
+            fetch_from = (last_day + timedelta(days=1)).isoformat()
+        else:
+            fetch_from = covered_from
+
+        fresh = self.get_historical_bars(
+            symbol, "1Day", start=datetime.fromisoformat(fetch_from).replace(tzinfo=EASTERN_TZ)
+        )
+        completed = [bar for bar in fresh if bar["t"][:10] < today_str]
+        forming = [bar for bar in fresh if bar["t"][:10] >= today_str]
+
+        if completed or refetch:
+            history = history + completed
+            if len(history) > DAILY_BARS_MAX_CACHED:
+                history = history[-DAILY_BARS_MAX_CACHED:]
+                covered_from = history[0]["t"][:10]
+            try:
+                DAILY_BARS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_file.with_suffix(".tmp")
+                with tmp_path.open("w", encoding="utf-8") as f:
+                    json.dump({"covered_from": covered_from, "bars": history}, f)
+                os.replace(tmp_path, cache_file)
+            except OSError as exc:
+                self.logger.debug("Could not persist daily bars for %s: %s", symbol, exc)
+
+        return [bar for bar in history if bar["t"][:10] >= window_start] + forming
+
     def get_previous_close(self, symbol: str) -> float:
-        bars = self.get_historical_bars(symbol, "1Day", start=datetime.utcnow() - timedelta(days=5), limit=2)
+        today = datetime.now(EASTERN_TZ).date().isoformat()
+        cached = self._prev_closes_for(today).get(symbol)
+        if cached is not None:
+            return cached
+
+        bars = self.get_historical_bars(symbol, "1Day", start=datetime.now(UTC) - timedelta(days=5), limit=2)
         if len(bars) < 2:
             raise RuntimeError("Not enough historical data to determine previous close")
-        return float(bars[-2]["c"])
+        prev_close = float(bars[-2]["c"])
+
+        with self._prev_close_lock:
+            closes = self._prev_closes_for(today)
+            closes[symbol] = prev_close
+            self._save_prev_closes(today, closes)
+        return prev_close
 
+    def _prev_closes_for(self, day: str) -> Dict[str, float]:
+        """Return the previous-close cache for ``day``, loading it from disk once per day."""
+        if self._prev_close_day != day:
+            closes: Dict[str, float] = {}
+            try:
+                with PREV_CLOSE_CACHE_FILE.open("r", encoding="utf-8") as f:
+                    stored = json.load(f)
+                if stored.get("date") == day:
+                    closes = {sym: float(value) for sym, value in stored.get("closes", {}).items()}
+            except (OSError, ValueError, AttributeError):
+                pass
+            self._prev_close_cache = closes
+            self._prev_close_day = day
+        return self._prev_close_cache
+
+    def _save_prev_closes(self, day: str, closes: Dict[str, float]) -> None:
+        try:
+            ensure_directories()
+            tmp_path = PREV_CLOSE_CACHE_FILE.with_suffix(".tmp")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump({"date": day, "closes": closes}, f)
+            os.replace(tmp_path, PREV_CLOSE_CACHE_FILE)
+        except OSError as exc:
+            self.logger.debug("Could not persist previous-close cache: %s", exc)
+
+    @_log_failure("fetch current price")
     def get_current_price(self, symbol: str) -> float:
         """Get current market price for a symbol."""
-        try:
-            quote = self.client.get_latest_quote(symbol, feed=self.data_feed)
-            # Use mid-point of bid/ask for better accuracy
-            ask = float(quote.ask_price) if quote.ask_price else 0
-            bid = float(quote.bid_price) if quote.bid_price else 0
-            
-            if ask > 0 and bid > 0:
-                return (ask + bid) / 2
-            elif ask > 0:
-                return ask
-            elif bid > 0:
-                return bid
-            else:
-                # Fallback to last trade price
-                return float(quote.price) if hasattr(quote, 'price') else 0.0
-        except Exception as exc:
-            self.logger.error("Failed to fetch current price for %s: %s", symbol, exc)
-            raise
+        quote = self.client.get_latest_quote(symbol, feed=self.data_feed)
+        # Zero bid/ask means no quote on that side; fall back to last trade price
+        price = self._mid_price(quote.ask_price or None, quote.bid_price or None, getattr(quote, 'price', None))
+        return price if price is not None else 0.0
 
-    def get_option_chain(self, symbol: str, expiration: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Fetch option chain for underlying symbol."""
-        try:
-            from alpaca.trading.requests import GetOptionContractsRequest
-            from datetime import datetime, timedelta, date
-            
-            # Get 0DTE and 1DTE options
-            if expiration:
-                # Handle both string and date formats
-                if isinstance(expiration, str):
-                    try:
-                        exp_date = datetime.strptime(expiration, '%Y-%m-%d').date()
-                    except ValueError:
-                        exp_date = datetime.fromisoformat(expiration).date()
-                else:
-                    exp_date = expiration if isinstance(expiration, date) else expiration.date()
-                
-                request = GetOptionContractsRequest(
-                    underlying_symbols=[symbol],
-                    status='active',
-                    expiration_date=exp_date.strftime('%Y-%m-%d'),
-                    limit=200
-                )
-            else:
-                # Get nearest expirations (next 5 days to catch weekly options)
-                today = datetime.now().date()
-                end_date = (datetime.now() + timedelta(days=5)).date()
-                
-                request = GetOptionContractsRequest(
-                    underlying_symbols=[symbol],
-                    status='active',
-                    expiration_date_gte=today.strftime('%Y-%m-%d'),
-                    expiration_date_lte=end_date.strftime('%Y-%m-%d'),
-                    limit=200
-                )
-            
-            self.logger.debug("Fetching options for %s with request: %s", symbol, request)
-            response = self.trading_client.get_option_contracts(request)
-            
-            if not response or not hasattr(response, 'option_contracts'):
-                self.logger.warning("No option contracts in response for %s", symbol)
+    def get_option_chain(self, symbol: str, expiration: Optional[str] = None) -> List[OptionContract]:
+        """Fetch option chain for underlying symbol (cached, see OPTION_CHAIN_TTL_SECONDS).
+
+        Without an expiration, every weekday in the next OPTION_CHAIN_DAYS days is
+        requested separately and in parallel, so each date returns its full strike
+        ladder instead of sharing one capped response.
+        """
+        if not expiration:
+            today = datetime.now(EASTERN_TZ).date()
+            dates = [
+                (today + timedelta(days=offset)).isoformat()
+                for offset in range(OPTION_CHAIN_DAYS + 1)
+                if (today + timedelta(days=offset)).weekday() < 5
+            ]
+            if not dates:
                 return []
-            
-            contracts = response.option_contracts
-            self.logger.debug("Found %d option contracts for %s", len(contracts), symbol)
-            
-            # Convert to dict format
-            chain = []
-            for contract in contracts:
-                try:
-                    chain.append({
-                        'symbol': str(contract.symbol) if hasattr(contract, 'symbol') else '',
-                        'strike_price': float(contract.strike_price) if hasattr(contract, 'strike_price') else 0.0,
-                        'option_type': str(contract.type) if hasattr(contract, 'type') else '',
-                        'expiration_date': str(contract.expiration_date) if hasattr(contract, 'expiration_date') else '',
-                        'open_interest': int(contract.open_interest) if hasattr(contract, 'open_interest') and contract.open_interest else 0,
-                        'size': int(contract.size) if hasattr(contract, 'size') else 100,
-                    })
-                except Exception as e:
-                    self.logger.warning("Error parsing contract for %s: %s", symbol, e)
-                    continue
-            
-            return chain
+            with ThreadPoolExecutor(max_workers=len(dates)) as executor:
+                chains = list(executor.map(lambda exp: self.get_option_chain(symbol, exp), dates))
+            return [contract for chain in chains for contract in chain]
+
+        key = (symbol, str(expiration))
+        cached = self._chain_cache.get(key)
+        if cached is not None:
+            expires_at, chain = cached
+            if time.time() < expires_at:
+                return chain
+
+        try:
+            chain = self._fetch_option_chain(symbol, expiration)
         except Exception as exc:
             self.logger.error("Failed to fetch option chain for %s: %s (type: %s)", symbol, exc, type(exc).__name__)
             import traceback
             self.logger.debug("Traceback: %s", traceback.format_exc())
             return []
 
+        ttl = OPTION_CHAIN_TTL_SECONDS if chain else EMPTY_OPTION_CHAIN_TTL_SECONDS
+        self._chain_cache[key] = (time.time() + ttl, chain)
+        return chain
+
+    def _fetch_option_chain(self, symbol: str, expiration: Any) -> List[OptionContract]:
+        from alpaca.trading.requests import GetOptionContractsRequest
+        from datetime import date
+
+        # Handle both string and date formats
+        if isinstance(expiration, str):
+            try:
+                exp_date = datetime.strptime(expiration, '%Y-%m-%d').date()
+            except ValueError:
+                exp_date = datetime.fromisoformat(expiration).date()
+        else:
+            exp_date = expiration if isinstance(expiration, date) else expiration.date()
+
+        request = GetOptionContractsRequest(
+            underlying_symbols=[symbol],
+            status='active',
+            expiration_date=exp_date.strftime('%Y-%m-%d'),
+            limit=OPTION_CONTRACTS_PAGE_LIMIT
+        )
+
+        self.logger.debug("Fetching options for %s with request: %s", symbol, request)
+        contracts = []
+        while True:
+            response = self.trading_client.get_option_contracts(request)
+            if not response or not hasattr(response, 'option_contracts'):
+                break
+            contracts.extend(response.option_contracts or [])
+            if not response.next_page_token:
+                break
+            request.page_token = response.next_page_token
+
+        if not contracts:
+            self.logger.debug("No option contracts for %s expiring %s", symbol, exp_date)
+            return []
+        
+        self.logger.debug("Found %d option contracts for %s", len(contracts), symbol)
+        
+        chain = []
+        for contract in contracts:
+            try:
+                contract_type = getattr(contract, 'type', '')
+                chain.append(OptionContract(
+                    symbol=str(getattr(contract, 'symbol', '')),
+                    strike_price=float(getattr(contract, 'strike_price', 0.0)),
+                    # ContractType is a str enum; str() would give "ContractType.CALL"
+                    option_type=str(getattr(contract_type, 'value', contract_type)),
+                    expiration_date=str(getattr(contract, 'expiration_date', '')),
+                    open_interest=int(getattr(contract, 'open_interest', 0) or 0),
+                    size=int(getattr(contract, 'size', 100)),
+                ))
+            except Exception as e:
+                self.logger.warning("Error parsing contract for %s: %s", symbol, e)
+                continue
+        
+        return chain
+
     def get_option_quote(self, option_symbol: str) -> Optional[Dict[str, Any]]:
         try:
             quote = self.client.get_option_quote(option_symbol)
@@ -223,16 +480,14 @@ class BrokerClient:
         quote = self.get_option_quote(option_symbol)
         if not quote:
             return None
-        ask = quote.get("ask_price")
-        bid = quote.get("bid_price")
+        return self._mid_price(quote.get("ask_price"), quote.get("bid_price"), quote.get("last_price"))
+
+    @staticmethod
+    def _mid_price(ask: Optional[float], bid: Optional[float], last: Optional[float]) -> Optional[float]:
+        """Bid/ask mid-point, else the first available of ask, bid and last."""
         if ask is not None and bid is not None:
-            return float((ask + bid) / 2)
-        if ask is not None:
-            return float(ask)
-        if bid is not None:
-            return float(bid)
-        last_price = quote.get("last_price")
-        return float(last_price) if last_price is not None else None
+            return (float(ask) + float(bid)) / 2
+        return next((float(price) for price in (ask, bid, last) if price is not None), None)
 
     # -------------------- Orders --------------------
     def submit_order(
@@ -244,16 +499,19 @@ class BrokerClient:
         time_in_force: str = "day",
         limit_price: Optional[float] = None,
     ) -> Dict[str, Any]:
-        order = self.client.submit_order(
-            symbol=symbol,
-            qty=qty,
-            side=side,
-            type=type_,
-            time_in_force=time_in_force,
-            limit_price=limit_price,
-        )
-        self.logger.info("Submitted order %s", order.id)
-        return order._raw
+        params: Dict[str, Any] = {
+            "symbol": symbol,
+            "side": side,
+            "type": type_,
+            "time_in_force": time_in_force,
+            "qty": qty,
+        }
+        if limit_price is not None:
+            params["limit_price"] = float(limit_price)
+        # Posted through the SDK's request path (keeps its retries); the raw dict skips Order wrapping
+        order = self.client.post("/orders", params)
+        self.logger.info("Submitted order %s", order.get("id"))
+        return order
 
     def get_order(self, order_id: str) -> Dict[str, Any]:
         return self.client.get_order(order_id)._raw
@@ -262,7 +520,8 @@ class BrokerClient:
         self.client.cancel_order(order_id)
 
     def list_positions(self) -> List[Dict[str, Any]]:
-        return [position._raw for position in self.client.list_positions()]
+        # Plain JSON: callers only read fields, so skip Position entity wrapping
+        return self.client.get("/positions")
 
     def close_position(self, symbol: str) -> Dict[str, Any]:
         order = self.client.close_position(symbol)
@@ -271,14 +530,11 @@ class BrokerClient:
     def get_account(self) -> Dict[str, Any]:
         return self.client.get_account()._raw
 
+    @_log_failure("fetch cash balance")
     def get_cash_balance(self) -> float:
         """Get available cash balance."""
-        try:
-            account = self.client.get_account()
-            return float(account.cash)
-        except Exception as exc:
-            self.logger.error("Failed to fetch cash balance: %s", exc)
-            raise
+        account = self.client.get_account()
+        return float(account.cash)
     
     def is_market_open(self) -> bool:
         """Check if the market is currently open."""
@@ -289,60 +545,56 @@ class BrokerClient:
             self.logger.error("Failed to check market status: %s", exc)
             return False
     
+    @_log_failure("fetch market hours")
     def get_market_hours(self) -> Dict[str, Any]:
         """Get market hours for today."""
-        try:
-            clock = self.client.get_clock()
-            return {
-                'is_open': clock.is_open,
-                'next_open': clock.next_open,
-                'next_close': clock.next_close,
-            }
-        except Exception as exc:
-            self.logger.error("Failed to fetch market hours: %s", exc)
-            raise
+        clock = self.client.get_clock()
+        return {
+            'is_open': clock.is_open,
+            'next_open': clock.next_open,
+            'next_close': clock.next_close,
+        }
     
-    def get_news(self, symbol: str, start: Optional[datetime] = None, end: Optional[datetime] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    def get_news(
+        self,
+        symbol: Union[str, List[str]],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 50,
+        fields: Iterable[str] = NEWS_FIELDS,
+    ) -> List[Dict[str, Any]]:
         """Get news articles for a symbol from Alpaca News API.
         
         Args:
-            symbol: Stock symbol
+            symbol: Stock symbol, or a list of symbols for one batched request
             start: Start datetime for news (default: 24 hours ago)
             end: End datetime for news (default: now)
             limit: Maximum number of articles (default: 50)
+            fields: Article keys to keep (default: all of NEWS_FIELDS)
             
         Returns:
-            List of news articles with headline, summary, author, created_at, url, symbols, sentiment
+            List of news articles restricted to ``fields``
         """
         try:
             if start is None:
-                start = datetime.now(pytz.UTC) - timedelta(hours=24)
+                start = datetime.now(UTC) - timedelta(hours=24)
             if end is None:
-                end = datetime.now(pytz.UTC)
+                end = datetime.now(UTC)
             
             # Ensure timezone aware
             if start.tzinfo is None:
-                start = pytz.UTC.localize(start)
+                start = start.replace(tzinfo=UTC)
             if end.tzinfo is None:
-                end = pytz.UTC.localize(end)
+                end = end.replace(tzinfo=UTC)
             
             # Alpaca News API endpoint (remove microseconds from timestamps)
             start_str = start.replace(microsecond=0).isoformat()
             end_str = end.replace(microsecond=0).isoformat()
-            news = self.client.get_news(symbol, start=start_str, end=end_str, limit=limit)
-            
-            articles = []
-            for article in news:
-                articles.append({
-                    'headline': article.headline if hasattr(article, 'headline') else article.get('headline', ''),
-                    'summary': article.summary if hasattr(article, 'summary') else article.get('summary', ''),
-                    'author': article.author if hasattr(article, 'author') else article.get('author', ''),
-                    'created_at': article.created_at if hasattr(article, 'created_at') else article.get('created_at', ''),
-                    'url': article.url if hasattr(article, 'url') else article.get('url', ''),
-                    'symbols': article.symbols if hasattr(article, 'symbols') else article.get('symbols', []),
-                })
+            # raw=True yields the decoded JSON dicts without NewsV2 entity wrapping
+            news = self.client.get_news_iter(symbol, start=start_str, end=end_str, limit=limit, raw=True)
             
-            return articles
+            defaults = [(key, [] if key == "symbols" else '') for key in fields]
+            return [{key: article.get(key, default) for key, default in defaults} for article in news]
         except Exception as exc:
             self.logger.warning("Failed to fetch news for %s: %s", symbol, exc)
             return []
@@ -8,19 +8,26 @@ Run:
 """
 import json
 import logging
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+import numpy as np
 
 from utils import load_config, setup_logging, eastern_now
 from broker import BrokerClient
 from notifications import DiscordNotifier
-from signals import SignalDetector
+from signals import SignalDetector, ema_rsi
+
+# Max in-flight bar requests; keeps us well inside Alpaca's rate limit
+CONCURRENCY_LIMIT = 8
 
 
-def diagnose_symbol(detector: SignalDetector, symbol: str) -> Dict[str, Any]:
+def diagnose_symbol(detector: SignalDetector, symbol: str, bars: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
     cfg = detector.signals_cfg
 
-    # 1) Fetch bars
-    bars = detector._get_recent_bars(symbol)
+    # 1) Fetch bars (unless prefetched by the batch request)
+    if bars is None:
+        bars = detector._get_recent_bars(symbol)
     if not bars or len(bars) < max(cfg.get("ema_long_period", 21) + 5, 30):
         return {
             "symbol": symbol,
@@ -28,11 +35,25 @@ def diagnose_symbol(detector: SignalDetector, symbol: str) -> Dict[str, Any]:
             "bars": 0 if not bars else len(bars),
         }
 
-    # 2) Indicators
-    df = detector._prepare_dataframe(bars)
-    detector._compute_indicators(df)
-    latest = df.iloc[-1]
-    previous = df.iloc[-2]
+    # 2) Indicators on plain float arrays; only the last two rows are inspected
+    bars = sorted(bars, key=lambda bar: bar["t"])
+    close = np.fromiter((bar["c"] for bar in bars), dtype=np.float64, count=len(bars))
+    volume = np.fromiter((bar["v"] for bar in bars), dtype=np.float64, count=len(bars))
+    ema_short, ema_long, rsi = ema_rsi(
+        close,
+        cfg.get("ema_short_period", 9),
+        cfg.get("ema_long_period", 21),
+        cfg.get("rsi_period", 14),
+    )
+    diff = ema_short[-2:] - ema_long[-2:]
+    latest = {
+        "close": close[-1],
+        "ema_short": ema_short[-1],
+        "ema_long": ema_long[-1],
+        "diff": diff[-1],
+        "rsi": rsi[-1],
+    }
+    previous = {"diff": diff[-2]}
 
     # 3) EMA crossover
     direction = detector._detect_crossover(previous, latest)
@@ -58,14 +79,14 @@ def diagnose_symbol(detector: SignalDetector, symbol: str) -> Dict[str, Any]:
             "rsi_put_max": cfg.get("rsi_put_max", 40),
         }
 
-    # 5) Volume filter
-    vol_ok = detector._passes_volume_filter(df)
+    # 5) Volume filter (same rule as SignalDetector._passes_volume_filter)
+    lookback = cfg.get("volume_lookback", 20)
+    multiplier = cfg.get("volume_multiplier", 1.2)
+    recent = volume[-lookback - 1 : -1] if len(volume) >= lookback + 1 else volume[:-1]
+    avg_volume = float(recent.mean()) if len(recent) else 0.0
+    curr_volume = float(volume[-1])
+    vol_ok = len(volume) >= lookback + 1 and avg_volume != 0 and curr_volume >= multiplier * avg_volume
     if not vol_ok:
-        lookback = cfg.get("volume_lookback", 20)
-        multiplier = cfg.get("volume_multiplier", 1.2)
-        recent = df.iloc[-lookback - 1 : -1] if len(df) >= lookback + 1 else df.iloc[:-1]
-        avg_volume = float(recent["volume"].mean()) if len(recent) else 0.0
-        curr_volume = float(df.iloc[-1]["volume"])
         return {
             "symbol": symbol,
             "status": "volume_block",
@@ -86,13 +107,20 @@ def diagnose_symbol(detector: SignalDetector, symbol: str) -> Dict[str, Any]:
     }
 
 
+def _safe_diagnose(detector: SignalDetector, symbol: str, bars: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    try:
+        return diagnose_symbol(detector, symbol, bars)
+    except Exception as e:
+        return {"symbol": symbol, "status": "error", "error": str(e)}
+
+
 def main() -> None:
     config = load_config()
     setup_logging(config)
     logging.getLogger().setLevel(logging.INFO)
 
     broker = BrokerClient(config)
-    notifier = DiscordNotifier(config)
+    notifier = DiscordNotifier.from_config(config)
     detector = SignalDetector(broker, notifier, config)
 
     symbols = config.get("watchlist", {}).get("symbols", [])
@@ -101,13 +129,14 @@ def main() -> None:
         return
 
     print(f"\n🔍 Diagnosing signals @ {eastern_now().strftime('%Y-%m-%d %H:%M:%S %Z')}\n")
-    results = []
-    for sym in symbols:
-        try:
-            res = diagnose_symbol(detector, sym)
-        except Exception as e:
-            res = {"symbol": sym, "status": "error", "error": str(e)}
-        results.append(res)
+    # One multi-symbol request for the whole watchlist
+    bars_by_symbol = detector._get_recent_bars_multi(symbols)
+    if bars_by_symbol is not None:
+        results = [_safe_diagnose(detector, sym, bars_by_symbol.get(sym, [])) for sym in symbols]
+    else:
+        # Batch request failed; fall back to concurrent per-symbol fetches (results keep watchlist order)
+        with ThreadPoolExecutor(max_workers=min(CONCURRENCY_LIMIT, len(symbols))) as executor:
+            results = list(executor.map(lambda sym: _safe_diagnose(detector, sym), symbols))
 
     # Pretty print a compact summary line per symbol
     for res in results:
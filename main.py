@@ -1,6 +1,11 @@
+import atexit
+import csv
+import io
 import logging
 import os
+import queue
 import signal
+import socket
 import sys
 import threading
 import time
@@ -8,13 +13,38 @@ import hmac
 import hashlib
 import subprocess
 from collections import deque
-from datetime import datetime, timedelta
+from datetime import datetime, time as dt_time, timedelta, timezone
 from typing import Any, Dict, Optional, List
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial, wraps
+from pathlib import Path
 
+from apscheduler.executors.pool import ThreadPoolExecutor as SchedulerThreadPool
 from apscheduler.schedulers.background import BackgroundScheduler
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
 
 from broker import BrokerClient
 from monitor import PositionMonitor
@@ -23,25 +53,327 @@ from notifications import DiscordNotifier
 from signals import SignalDetector
 from utils import (
     EASTERN_TZ,
+    TradeStats,
     ensure_directories,
+    flush_trade_log,
     load_config,
     read_state,
+    save_config,
     setup_logging,
     update_state,
 )
 
 logger = logging.getLogger(__name__)
 
+# Option type as a small int so chain filtering is a single array comparison
+OPTION_TYPE_CODES = {"call": 1, "c": 1, "put": 2, "p": 2}
+
+# Pending orders are resolved by the position-monitor tick once they reach a final state
+TERMINAL_ORDER_STATUSES = frozenset({"filled", "canceled", "rejected", "expired", "done_for_day"})
+
+# Errors older than this no longer count towards tripping the circuit breaker
+CIRCUIT_BREAKER_WINDOW_SECONDS = 300
+
+# Local ngrok agent API, probed repeatedly at startup over one pooled session
+NGROK_API_URL = "http://localhost:4040/api/tunnels"
+_http = requests.Session()
+_http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Regular session boundaries (US/Eastern)
+MARKET_OPEN_TIME = dt_time(9, 30)
+MARKET_CLOSE_TIME = dt_time(16, 0)
+PREMARKET_SCAN_TIME = dt_time(8, 30)
+
+# Hot-path "now" is reused for up to a second: (monotonic stamp, tz-aware datetime)
+NOW_CACHE_SECONDS = 1.0
+_cached_now: tuple = (float("-inf"), None)
+
+# Repeat selections for the same symbol/direction/price within this window reuse the last pick
+CONTRACT_CACHE_TTL_SECONDS = 2.0
+
+
+@lru_cache(maxsize=4096)
+def _expiration_timestamp(expiration: str) -> float:
+    """Epoch seconds for an ISO expiration (naive dates are UTC); NaN if unparseable."""
+    try:
+        return datetime.fromisoformat(expiration).replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return float("nan")
+
+
+def _now_eastern() -> datetime:
+    """Current US/Eastern time, cached for NOW_CACHE_SECONDS across scheduler jobs."""
+    global _cached_now
+    stamp = time.monotonic()
+    cached = _cached_now
+    if stamp - cached[0] < NOW_CACHE_SECONDS:
+        return cached[1]
+    now = datetime.now(EASTERN_TZ)
+    _cached_now = (stamp, now)
+    return now
+
+
 # Flask app for web dashboard
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'scalp-bot-dashboard-secret'
 app.config['TEMPLATES_AUTO_RELOAD'] = True  # Force template reload
 app.jinja_env.auto_reload = True
 
+# Gzip the polled JSON endpoints (chart data, status) when Flask-Compress is installed
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
+
 # Suppress Flask logs
 log = logging.getLogger('werkzeug')
 log.setLevel(logging.ERROR)
 
+# Short-lived response cache for polled dashboard endpoints: key -> (expires_at, body, mimetype, etag)
+_response_cache: Dict[str, tuple] = {}
+_response_cache_lock = threading.Lock()
+
+
+def _cached_body_response(body: bytes, mimetype: str, etag: str) -> Response:
+    """Replay a cached body, or an empty 304 when the client already holds this ETag."""
+    if etag in request.if_none_match:
+        resp = Response(status=304)
+    else:
+        resp = Response(body, mimetype=mimetype)
+    resp.set_etag(etag)
+    return resp
+
+
+def cached_response(key: str, ttl_seconds: float):
+    """Serve a route's successful response from memory for ``ttl_seconds``.
+
+    Dashboard tabs poll these endpoints every few seconds; caching coalesces the
+    repeated broker calls and JSON serialization within the window. Each cached
+    body carries a content ETag so unchanged polls get a bodyless 304.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            with _response_cache_lock:
+                entry = _response_cache.get(key)
+            if entry and entry[0] > now:
+                return _cached_body_response(*entry[1:])
+
+            rv = view(*args, **kwargs)
+            if isinstance(rv, Response) and rv.status_code == 200:
+                body = rv.get_data()
+                etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+                with _response_cache_lock:
+                    _response_cache[key] = (now + ttl_seconds, body, rv.mimetype, etag)
+                return _cached_body_response(body, rv.mimetype, etag)
+            return rv
+        return wrapper
+    return decorator
+
+
+# Parsed trades.csv keyed on (st_mtime_ns, st_size); shared by the dashboard routes
+TRADES_CSV_PATH = 'data/trades.csv'
+# Declared column types for the trade log so read_csv skips per-column type inference
+TRADES_CSV_DTYPES = {
+    'ticker': str,
+    'direction': str,
+    'strike': 'float64',
+    'expiration': str,
+    'entry_price': 'float64',
+    'exit_price': 'float64',
+    'pnl_pct': 'float64',
+    'exit_reason': str,
+}
+# Typed columnar mirror of trades.csv so restarts skip CSV tokenizing and date parsing
+TRADES_PARQUET_PATH = 'data/trades.parquet'
+# Parquet schema metadata naming the exact trades.csv version ("mtime_ns:size") a mirror holds
+TRADES_PARQUET_KEY = b'trades_csv_key'
+_trades_cache: Dict[str, Any] = {'key': None, 'df': None, 'chart': None}
+_trades_cache_lock = threading.Lock()
+
+
+def _equity_curve(pnl: np.ndarray) -> np.ndarray:
+    """Running P/L total; rows without a P/L stay NaN but do not break the running sum."""
+    curve = np.nancumsum(pnl)
+    curve[np.isnan(pnl)] = np.nan
+    return curve
+
+
+def _load_trades_frames() -> Optional[tuple]:
+    """Return ``(trades, chart)`` DataFrames, re-parsing only when trades.csv changes.
+
+    ``trades`` has the file's columns with ``timestamp`` parsed. ``chart`` is the
+    same rows sorted by time with ``cumulative_pnl`` and ``day`` precomputed.
+    Both are shallow copies; returns None when there is no trade log yet.
+    """
+    try:
+        stat = os.stat(TRADES_CSV_PATH)
+    except FileNotFoundError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    with _trades_cache_lock:
+        if _trades_cache['key'] != key:
+            df = _read_trades_file(key)
+            # The log is appended in time order, so the sort is normally skipped
+            if df['timestamp'].is_monotonic_increasing:
+                chart = df.copy(deep=False)
+            else:
+                chart = df.sort_values('timestamp')
+            chart['cumulative_pnl'] = _equity_curve(chart['pnl_pct'].to_numpy(dtype=float))
+            # Calendar day of each trade (in the log's own timezone) as int days since epoch
+            timestamps = chart['timestamp']
+            if timestamps.dt.tz is not None:
+                timestamps = timestamps.dt.tz_localize(None)
+            chart['day'] = timestamps.to_numpy().astype('datetime64[D]').astype(np.int64)
+            _trades_cache.update(key=key, df=df, chart=chart)
+        return _trades_cache['df'].copy(deep=False), _trades_cache['chart'].copy(deep=False)
+
+
+# Win/loss aggregates for /api/performance, folded in as trades are appended
+_trade_stats = TradeStats(TRADES_CSV_PATH)
+
+
+def _read_trades_file(csv_key: tuple) -> pd.DataFrame:
+    """Read the trade log, preferring the parquet mirror when pyarrow is installed.
+
+    trades.csv stays the source of truth: the mirror is used only if it was built
+    from exactly this version of the CSV (``csv_key`` is its ``(st_mtime_ns, st_size)``),
+    and is rewritten only if the CSV did not change while it was being read.
+    """
+    stamp = ('%d:%d' % csv_key).encode()
+    if PARQUET_AVAILABLE:
+        try:
+            mirror = pq.ParquetFile(TRADES_PARQUET_PATH)
+            if (mirror.schema_arrow.metadata or {}).get(TRADES_PARQUET_KEY) == stamp:
+                return mirror.read().to_pandas()
+        except FileNotFoundError:
+            pass
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Ignoring unreadable trades parquet mirror: %s", exc)
+
+    df = pd.read_csv(TRADES_CSV_PATH, dtype=TRADES_CSV_DTYPES, engine='c')
+    # ISO strings with Eastern offsets; via UTC so logs spanning a DST change still parse
+    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', utc=True).dt.tz_convert(EASTERN_TZ)
+
+    if PARQUET_AVAILABLE:
+        try:
+            after = os.stat(TRADES_CSV_PATH)
+            if (after.st_mtime_ns, after.st_size) != csv_key:
+                # A row landed mid-read; a mirror stamped with csv_key could hide it
+                logger.debug("trades.csv changed while reading; not refreshing the parquet mirror")
+                return df
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), TRADES_PARQUET_KEY: stamp})
+            tmp_path = TRADES_PARQUET_PATH + '.tmp'
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, TRADES_PARQUET_PATH)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Could not write trades parquet mirror: %s", exc)
+    return df
+
+
+def _daily_pnl(day: np.ndarray, pnl: np.ndarray) -> List[Dict[str, Any]]:
+    """Sum P/L per calendar day with one bincount over sorted int day numbers."""
+    if day.size == 0:
+        return []
+    base = day[0]
+    offsets = day - base
+    sums = np.bincount(offsets, weights=np.nan_to_num(pnl))
+    present = np.flatnonzero(np.bincount(offsets))
+    labels = (present + base).astype('datetime64[D]').astype(str)
+    return [{'date': date, 'pnl': total} for date, total in zip(labels.tolist(), sums[present].tolist())]
+
+
+def _frame_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Row dicts built from whole-column ``tolist()`` values rather than per-row Series boxing."""
+    columns = list(frame.columns)
+    values = [frame[column].tolist() for column in columns]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+# Numeric trade-log columns, converted when rows are read without pandas
+TRADE_ROW_CONVERTERS = {
+    'strike': float,
+    'entry_price': float,
+    'exit_price': float,
+    'contracts': int,
+    'pnl_pct': float,
+}
+
+
+def _todays_trades(path, today_prefix: str, block_size: int = 65536) -> Optional[List[Dict[str, Any]]]:
+    """Rows of the append-only trade log whose timestamp starts with ``today_prefix``.
+
+    Scans back from the end in ``block_size`` steps until a complete line predates
+    today, so only today's tail is parsed. Returns None if the header has no
+    ``timestamp`` column (caller falls back to the DataFrame path).
+    """
+    prefix = today_prefix.encode()
+    with open(path, 'rb') as f:
+        header = f.readline()
+        start = f.tell()
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        data = b''
+        while pos > start:
+            pos = max(start, pos - block_size)
+            f.seek(pos)
+            data = f.read(end - pos)
+            newline = data.find(b'\n')
+            if pos > start and newline < 0:
+                continue
+            first = data if pos == start else data[newline + 1:]
+            if first and first[:len(prefix)] < prefix:
+                break
+    columns = next(csv.reader([header.decode('utf-8')]), [])
+    if 'timestamp' not in columns:
+        return None
+    if pos > start:
+        data = data[data.find(b'\n') + 1:]
+    # Skip a partially written last line
+    data = data[:data.rfind(b'\n') + 1]
+    lines = [line for line in data.decode('utf-8').splitlines() if line.startswith(today_prefix)]
+    
+    trades = []
+    for row in csv.reader(lines):
+        trade = dict(zip(columns, row))
+        for column, convert in TRADE_ROW_CONVERTERS.items():
+            value = trade.get(column)
+            if value is not None:
+                try:
+                    trade[column] = convert(value)
+                except ValueError:
+                    trade[column] = None
+        trades.append(trade)
+    return trades
+
+
+def _trades_since(chart: pd.DataFrame, start: datetime, inclusive: bool = True) -> pd.DataFrame:
+    """Rows of the time-sorted chart frame at (or after) ``start``, found by binary search."""
+    timestamps = chart['timestamp']
+    bound = pd.Timestamp(start)
+    if timestamps.dt.tz is None:
+        # Naive log timestamps are Eastern wall-clock times
+        bound = bound.tz_localize(None)
+    lo = timestamps.searchsorted(bound, side='left' if inclusive else 'right')
+    return chart.iloc[lo:]
+
+
+def _load_trades_df() -> Optional[pd.DataFrame]:
+    """Parsed trade log (cached on file mtime), or None when it does not exist."""
+    frames = _load_trades_frames()
+    return frames[0] if frames else None
+
+
+def invalidate_response(*keys: str) -> None:
+    """Drop cached responses so the next request sees fresh state."""
+    with _response_cache_lock:
+        for key in keys:
+            _response_cache.pop(key, None)
+
 
 class ScalpingBot:
     """Top-level orchestrator for the options scalping workflow."""
@@ -72,7 +404,6 @@ class ScalpingBot:
             self._ensure_ngrok_running()
         else:
             # No ngrok, get local IP for dashboard access
-            import socket
             try:
                 # Get local IP address
                 s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -85,21 +416,44 @@ class ScalpingBot:
                 self.ngrok_url = "http://localhost:8001"
                 logger.info("Using localhost (no ngrok)")
         
-        self.notifier = DiscordNotifier(self.config)
+        # Dashboard URL is known now, so the single notifier gets it from the start
+        self.config.setdefault('dashboard', {})['public_url'] = self._get_dashboard_url()
+        self.notifier = DiscordNotifier.from_config(self.config)
 
         self.broker = BrokerClient(self.config)
         self.signal_detector = SignalDetector(self.broker, self.notifier, self.config)
         self.monitor = PositionMonitor(self.broker, self.notifier, self.signal_detector, self.config)
         self.news_sentiment = NewsSentimentAnalyzer(self.config)
 
-        self.scheduler = BackgroundScheduler(timezone=EASTERN_TZ)
+        self._shutdown_event = threading.Event()
+        # Reused across 15s signal polls instead of spawning threads every tick
+        self._signal_pool = ThreadPoolExecutor(
+            max_workers=self.config.get("signals", {}).get("max_workers", 8),
+            thread_name_prefix="signal-eval",
+        )
+
+        # Size the scheduler pool explicitly so the 5s monitor and 15s signal
+        # jobs never queue behind each other; slow news analysis gets its own pool
+        scheduler_cfg = self.config.get("scheduler", {})
+        self.scheduler = BackgroundScheduler(
+            executors={
+                "default": SchedulerThreadPool(scheduler_cfg.get("max_workers", 20)),
+                "news": SchedulerThreadPool(scheduler_cfg.get("news_workers", 2)),
+            },
+            job_defaults={
+                "coalesce": True,
+                "misfire_grace_time": scheduler_cfg.get("misfire_grace_time", 30),
+                "max_instances": 1,
+            },
+            timezone=EASTERN_TZ,
+        )
         
         # News cache
         self.news_cache = []
         self.news_last_updated = None
         
         # Circuit breaker for error tracking
-        self.error_window = deque(maxlen=10)  # Track last 10 errors
+        self.error_window = deque()  # Error timestamps within the last CIRCUIT_BREAKER_WINDOW_SECONDS
         self.circuit_breaker_threshold = 5  # Trip after 5 errors in window
         self.circuit_open = False
         
@@ -111,29 +465,63 @@ class ScalpingBot:
         self.daily_trades_count = 0
         self.daily_pnl_pct = 0.0
         self.daily_loss_limit_hit = False
+        # Incremental trades.csv reader state (see _calculate_daily_stats); the lock
+        # serialises the scheduler's limit checks and dashboard requests
+        self._trades_lock = threading.Lock()
+        self._trades_offset = 0
+        self._trades_columns = None
+        self._today_date = None
+        self._today_count = 0
+        self._today_pnl_sum = 0.0
+        
+        # (symbol, direction, price) -> (monotonic time, selected contract)
+        self._contract_cache: Dict[tuple, tuple] = {}
+        # order_id -> {"event", "order"}, resolved by the position-monitor tick
+        self._pending_fills: Dict[str, Dict[str, Any]] = {}
+        self._pending_fills_lock = threading.Lock()
+        self._load_trading_settings()
+        # Keyed HMAC-SHA256 template for webhook signatures (None when no secret is set)
+        secret = self.config.get("webhook_secret", "")
+        self._webhook_mac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256) if secret else None
+        # Direction-specialized selectors: option type and moneyness sign are bound once
+        self._contract_selectors = {
+            "call": partial(self._select_option_contract, type_code=OPTION_TYPE_CODES["call"], otm_sign=1.0),
+            "put": partial(self._select_option_contract, type_code=OPTION_TYPE_CODES["put"], otm_sign=-1.0),
+        }
         
         self._register_jobs()
         self._log_startup_info()
     
+    def _load_trading_settings(self) -> None:
+        """Copy trade-path settings to attributes; call again whenever config['trading'] changes."""
+        trading_cfg = self.config.get("trading", {})
+        self._max_dte_days = trading_cfg.get("max_option_dte_days")
+        self._atm_tol_pct = trading_cfg.get("atm_tolerance_pct")
+        self._max_otm_pct = trading_cfg.get("max_otm_pct")
+        self._max_risk_pct = trading_cfg.get("max_risk_pct", 0.01)
+    
+    @staticmethod
+    def _probe_ngrok_tunnel() -> Optional[str]:
+        """Return the public HTTPS tunnel URL from the local ngrok agent, if any."""
+        try:
+            response = _http.get(NGROK_API_URL, timeout=2)
+            if response.status_code == 200:
+                for tunnel in response.json().get("tunnels", []):
+                    if tunnel.get("proto") == "https":
+                        return tunnel.get("public_url")
+        except (requests.RequestException, ValueError):
+            pass
+        return None
+    
     def _ensure_ngrok_running(self) -> None:
         """Start ngrok and get its URL."""
-        import subprocess
-        import requests
-        import time
-        
         try:
             # Check if ngrok already running
-            try:
-                response = requests.get("http://localhost:4040/api/tunnels", timeout=2)
-                if response.status_code == 200:
-                    tunnels = response.json().get("tunnels", [])
-                    https_tunnels = [t for t in tunnels if t.get("proto") == "https"]
-                    if https_tunnels:
-                        self.ngrok_url = https_tunnels[0].get("public_url")
-                        logger.info("✅ ngrok already running: %s", self.ngrok_url)
-                        return
-            except:
-                pass
+            tunnel_url = self._probe_ngrok_tunnel()
+            if tunnel_url:
+                self.ngrok_url = tunnel_url
+                logger.info("✅ ngrok already running: %s", self.ngrok_url)
+                return
             
             # Kill any old ngrok processes
             logger.info("Starting ngrok tunnel...")
@@ -166,17 +554,11 @@ class ScalpingBot:
             
             # Wait for tunnel to establish
             for attempt in range(10):
-                try:
-                    response = requests.get("http://localhost:4040/api/tunnels", timeout=2)
-                    if response.status_code == 200:
-                        tunnels = response.json().get("tunnels", [])
-                        https_tunnels = [t for t in tunnels if t.get("proto") == "https"]
-                        if https_tunnels:
-                            self.ngrok_url = https_tunnels[0].get("public_url")
-                            logger.info("✅ ngrok tunnel started: %s", self.ngrok_url)
-                            return
-                except:
-                    pass
+                tunnel_url = self._probe_ngrok_tunnel()
+                if tunnel_url:
+                    self.ngrok_url = tunnel_url
+                    logger.info("✅ ngrok tunnel started: %s", self.ngrok_url)
+                    return
                 time.sleep(2)
             
             # Failed to start
@@ -229,17 +611,12 @@ class ScalpingBot:
             self.config['dashboard'] = {}
         self.config['dashboard']['public_url'] = dashboard_url
         
-        # Reinitialize notifier with updated config (including dashboard URL)
-        self.notifier = DiscordNotifier(self.config)
-        
-        # Update notifier references in all components
-        self.signal_detector.notifier = self.notifier
-        self.monitor.notifier = self.notifier
+        # Update the shared notifier in place; components keep their reference
+        self.notifier.refresh_config(self.config)
         
         # Send startup notification with dashboard link
         if self.notifier.is_configured():
             # Get local IP for WiFi access
-            import socket
             local_ip_url = None
             try:
                 s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -293,6 +670,7 @@ class ScalpingBot:
             hours=1,
             next_run_time=datetime.now(EASTERN_TZ),
             name="news-analyzer",
+            executor="news",
             max_instances=1,
         )
 
@@ -301,17 +679,20 @@ class ScalpingBot:
         self.scheduler.start()
         self._install_signal_handlers()
         try:
-            while True:
-                time.sleep(1)
+            # Block without waking until a signal handler requests shutdown
+            self._shutdown_event.wait()
         except (KeyboardInterrupt, SystemExit):
-            logger.info("Shutdown requested; stopping scheduler")
-            self.scheduler.shutdown(wait=False)
+            pass
+        logger.info("Shutdown requested; stopping scheduler")
+        self.scheduler.shutdown(wait=False)
+        self._signal_pool.shutdown(wait=False, cancel_futures=True)
+        # Give queued Discord alerts a moment to go out before the process exits
+        self.notifier.close(timeout=5)
 
     def _install_signal_handlers(self) -> None:
         def _handle_signal(signum: int, frame: Optional[Any]) -> None:  # noqa: ANN401
             logger.info("Received signal %s; shutting down", signum)
-            self.scheduler.shutdown(wait=False)
-            sys.exit(0)
+            self._shutdown_event.set()
 
         signal.signal(signal.SIGINT, _handle_signal)
         signal.signal(signal.SIGTERM, _handle_signal)
@@ -319,50 +700,95 @@ class ScalpingBot:
     # -------------------- Scheduled Tasks --------------------
     def _is_market_hours(self) -> bool:
         """Check if current time is during market hours (Mon-Fri 9:30 AM - 4:00 PM ET)."""
-        now = datetime.now(EASTERN_TZ)
+        now = _now_eastern()
         
         # Check if weekday (Monday=0, Sunday=6)
         if now.weekday() >= 5:  # Saturday or Sunday
             return False
         
         # Check if within trading hours (9:30 AM - 4:00 PM)
-        market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-        market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
-        
-        return market_open <= now <= market_close
+        return MARKET_OPEN_TIME <= now.time() <= MARKET_CLOSE_TIME
     
     def _calculate_daily_stats(self) -> tuple[int, float]:
         """Calculate today's trade count and P/L from trades.csv.
         
+        trades.csv is append-only, so each call parses only the rows written
+        since the previous call; the running totals restart each Eastern day.
+        
         Returns:
             (trade_count, total_pnl_pct)
         """
-        from pathlib import Path
+        # Risk limits must count every logged exit, including rows still buffered
         try:
-            csv_path = Path('data/trades.csv')
-            if not csv_path.exists():
-                return 0, 0.0
-            
-            df = pd.read_csv(csv_path)
-            if len(df) == 0:
-                return 0, 0.0
+            flush_trade_log()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not flush buffered trades before daily stats: %s", exc)
+        try:
+            with self._trades_lock:
+                csv_path = Path(TRADES_CSV_PATH)
+                if not csv_path.exists():
+                    return 0, 0.0
             
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            today = datetime.now(EASTERN_TZ).date()
-            today_trades = df[df['timestamp'].dt.date == today]
+                today = _now_eastern().date()
+                if self._today_date != today:
+                    # Rows already consumed were all logged before today
+                    self._today_date = today
+                    self._today_count = 0
+                    self._today_pnl_sum = 0.0
             
-            trade_count = len(today_trades)
-            # Sum P/L as decimals (e.g., 0.05 for 5%)
-            total_pnl_pct = today_trades['pnl_pct'].sum() / 100.0 if trade_count > 0 else 0.0
+                size = csv_path.stat().st_size
+                if size < self._trades_offset:
+                    # File was replaced or truncated; start over
+                    self._trades_offset = 0
+                    self._trades_columns = None
+                    self._today_count = 0
+                    self._today_pnl_sum = 0.0
+                if size > self._trades_offset:
+                    self._read_new_trades(csv_path, today)
             
-            return trade_count, total_pnl_pct
+                # Sum P/L as decimals (e.g., 0.05 for 5%)
+                return self._today_count, self._today_pnl_sum / 100.0
         except Exception as exc:
             logger.error("Error calculating daily stats: %s", exc)
             return 0, 0.0
     
+    def _read_new_trades(self, csv_path, today) -> None:
+        """Fold complete rows appended since ``self._trades_offset`` into today's totals.
+
+        Caller holds ``self._trades_lock``.
+        """
+        start = self._trades_offset
+        with csv_path.open('rb') as f:
+            f.seek(start)
+            chunk = f.read()
+        # Leave a partially written last line for the next call
+        end = chunk.rfind(b'\n') + 1
+        if not end:
+            return
+        
+        for row in csv.reader(io.StringIO(chunk[:end].decode('utf-8'))):
+            if not row:
+                continue
+            if self._trades_columns is None:
+                self._trades_columns = (row.index('timestamp'), row.index('pnl_pct'))
+                continue
+            ts_idx, pnl_idx = self._trades_columns
+            try:
+                timestamp = datetime.fromisoformat(row[ts_idx])
+                if timestamp.tzinfo is not None:
+                    timestamp = timestamp.astimezone(EASTERN_TZ)
+                if timestamp.date() != today:
+                    continue
+                pnl_pct = float(row[pnl_idx]) if row[pnl_idx] else 0.0
+            except (ValueError, IndexError):
+                continue
+            self._today_count += 1
+            self._today_pnl_sum += pnl_pct
+        self._trades_offset = start + end
+    
     def _reset_daily_limits_if_needed(self) -> None:
         """Reset daily counters if it's a new trading day."""
-        today = datetime.now(EASTERN_TZ).date()
+        today = _now_eastern().date()
         if self.daily_reset_date != today:
             self.daily_reset_date = today
             # Recalculate from trades.csv
@@ -407,12 +833,14 @@ class ScalpingBot:
     def pause_trading(self) -> None:
         """Pause automated trading."""
         self.paused = True
+        invalidate_response("status")
         logger.warning("Trading PAUSED by user")
         self.notifier.send("⏸️ **Trading PAUSED**")
     
     def resume_trading(self) -> None:
         """Resume automated trading."""
         self.paused = False
+        invalidate_response("status")
         logger.info("Trading RESUMED by user")
         self.notifier.send("▶️ **Trading RESUMED**")
     
@@ -434,6 +862,7 @@ class ScalpingBot:
             
             # Use monitor to close position
             self.monitor._force_close(reason="manual_force_close")
+            invalidate_response("status")
             return True
         except Exception as exc:
             logger.exception("Error force closing position: %s", exc)
@@ -465,6 +894,17 @@ class ScalpingBot:
         try:
             state = read_state()
             
+            # Cheap state check first: nothing below matters while a trade is open
+            open_position = state.get("open_position")
+            if open_position:
+                logger.info(f"⏸️ Already have open position for {open_position.get('ticker')} - skipping new signals")
+                return
+
+            allowed, reason = self._check_daily_limits()
+            if not allowed:
+                logger.info(f"🛑 {reason} - skipping signal evaluation")
+                return
+            
             # Get ALL watchlist tickers (not just top 3 from scan)
             watchlist_symbols = self.config.get('watchlist', {}).get('symbols', [])
             
@@ -476,11 +916,6 @@ class ScalpingBot:
             active_tickers = [{"symbol": symbol, "rank": i+1} for i, symbol in enumerate(watchlist_symbols)]
             
             logger.info(f"📋 Checking ALL {len(active_tickers)} watchlist tickers: {watchlist_symbols}")
-            
-            open_position = state.get("open_position")
-            if open_position:
-                logger.info(f"⏸️ Already have open position for {open_position.get('ticker')} - skipping new signals")
-                return
 
             logger.info("🎯 No open positions - checking for new signals...")
             logger.info(f"⚡ Checking {len(active_tickers)} tickers in PARALLEL...")
@@ -507,16 +942,15 @@ class ScalpingBot:
             
             # Execute all ticker checks in parallel
             signals_found = []
-            with ThreadPoolExecutor(max_workers=len(active_tickers)) as executor:
-                # Submit all ticker checks
-                futures = {executor.submit(check_ticker, ticker_info): ticker_info 
-                          for ticker_info in active_tickers}
-                
-                # Collect results as they complete
-                for future in as_completed(futures):
-                    rank, ticker, signal = future.result()
-                    if signal:
-                        signals_found.append((rank, ticker, signal))
+            # Submit all ticker checks to the long-lived pool
+            futures = {self._signal_pool.submit(check_ticker, ticker_info): ticker_info 
+                      for ticker_info in active_tickers}
+            
+            # Collect results as they complete
+            for future in as_completed(futures):
+                rank, ticker, signal = future.result()
+                if signal:
+                    signals_found.append((rank, ticker, signal))
             
             # If any signals found, take the highest ranked one
             if signals_found:
@@ -535,17 +969,19 @@ class ScalpingBot:
             self._record_error("signal")
     
     def _monitor_position(self) -> None:
-        """Monitor open positions (only during market hours)."""
-        # Skip if market is closed
+        """Monitor open positions (only during market hours) and resolve pending fills."""
+        # Skip position checks if market is closed
         if not self._is_market_hours():
             logger.debug("Market closed - skipping position monitoring")
-            return
+        else:
+            try:
+                self.monitor.evaluate()
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Error during position monitoring: %s", exc)
+                self.notifier.alert_error("position monitoring", exc)
         
-        try:
-            self.monitor.evaluate()
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("Error during position monitoring: %s", exc)
-            self.notifier.alert_error("position monitoring", exc)
+        if self._pending_fills:
+            self._poll_pending_fills()
     
     def _update_news(self) -> None:
         """Update news sentiment for watchlist tickers (runs hourly + on startup)."""
@@ -575,7 +1011,8 @@ class ScalpingBot:
         try:
             logger.info("Executing trade for signal: %s", signal_payload)
             
-            option_contract = self._select_option_contract(signal_payload)
+            select_contract = self._contract_selectors[signal_payload["direction"]]
+            option_contract = select_contract(signal_payload)
             if not option_contract:
                 logger.warning("No suitable option contract found for %s", signal_payload['symbol'])
                 return
@@ -609,7 +1046,8 @@ class ScalpingBot:
 
             fill_price = float(filled_order.get("filled_avg_price") or option_price)
             logger.info("Order filled: %dx %s at $%.2f", contracts, option_symbol, fill_price)
-            
+            self.monitor.watch_option(option_symbol)
+
             self.notifier.alert_order_filled(
                 ticker=signal_payload["symbol"],
                 option_symbol=option_symbol,
@@ -632,150 +1070,215 @@ class ScalpingBot:
                 }
             }
             update_state(state_update)
+            invalidate_response("status")
         except Exception as exc:  # noqa: BLE001
             logger.exception("Trade execution failed: %s", exc)
             self.notifier.alert_error("trade execution", exc)
             self._record_error("trade")
 
-    def _select_option_contract(self, signal_payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _select_option_contract(
+        self, signal_payload: Dict[str, Any], type_code: int, otm_sign: float
+    ) -> Optional[Dict[str, Any]]:
+        """Pick the nearest-expiry, nearest-ATM contract of ``type_code``.
+
+        Called through ``self._contract_selectors`` so the direction is resolved once.
+        """
         symbol = signal_payload["symbol"]
         direction = signal_payload["direction"]
+
+        # The cache key needs only the quote, so a hit during a signal burst skips the chain fetch
         underlying_price = self.broker.get_current_price(symbol)
+        cache_key = (symbol, direction, round(underlying_price, 2))
+        cached = self._contract_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < CONTRACT_CACHE_TTL_SECONDS:
+            logger.info(f"♻️ Reusing option selection for {symbol} {direction.upper()}: {cached[1]['symbol']}")
+            return dict(cached[1])
+        
+        chain = self.broker.get_option_chain(symbol)
         
         logger.info(f"🔍 Selecting option for {symbol} {direction.upper()}")
         logger.info(f"   Underlying price: ${underlying_price:.2f}")
         logger.info(f"   Strategy: Nearest ATM strike on next expiring contract")
         
-        chain = self.broker.get_option_chain(symbol)
         if not chain:
             logger.error(f"❌ No option chain available for {symbol}")
             return None
         
         logger.info(f"   Got {len(chain)} options in chain")
 
-        now = datetime.utcnow()
-        candidates = []
-        
-        # Filter for correct option type and valid data
-        for option in chain:
-            option_type = str(option.get("type") or option.get("option_type") or option.get("option_type"))
-            if not option_type:
-                continue
-            option_type = option_type.lower()
-            
-            # Filter by option type (CALL or PUT)
-            if direction == "call" and option_type not in {"call", "c"}:
-                continue
-            if direction == "put" and option_type not in {"put", "p"}:
-                continue
-
-            # Get strike
-            strike_raw = option.get("strike") or option.get("strike_price")
-            if strike_raw is None:
-                continue
-            strike = float(strike_raw)
-
-            # Get expiration
-            expiration_raw = option.get("expiration") or option.get("expiration_date")
-            if not expiration_raw:
-                continue
-            try:
-                expiration = datetime.fromisoformat(expiration_raw)
-            except ValueError:
-                continue
-            
-            # Calculate DTE
-            dte = max((expiration - now).total_seconds() / 86400.0, 0)
-
-            # Get price
-            price = self._infer_option_price(option)
-            if price is None or price <= 0:
-                continue
-
-            # Calculate how close strike is to ATM
-            strike_distance = abs(strike - underlying_price)
-
-            candidates.append({
-                "symbol": option.get("symbol"),
-                "strike": strike,
-                "expiration": expiration_raw,
-                "price": price,
-                "dte": dte,
-                "strike_distance": strike_distance,
-            })
-        
-        if not candidates:
+        arrays = self._chain_to_arrays(chain)
+        dte = np.maximum((arrays["expiration_ts"] - time.time()) / 86400.0, 0.0)
+        # Signed moneyness: positive is OTM for both calls and puts
+        otm_distance = (arrays["strike"] - underlying_price) * otm_sign
+        strike_distance = np.abs(otm_distance)
+        price = self._infer_option_prices(arrays["ask"], arrays["bid"], arrays["last"])
+
+        # NaN strike/expiration/price rows fail every comparison below
+        mask = (
+            (arrays["type_code"] == type_code)
+            & (strike_distance >= 0)
+            & (dte >= 0)
+            & (price > 0)
+        )
+        if self._max_dte_days is not None:
+            mask &= dte <= self._max_dte_days + 0.1
+        if self._atm_tol_pct is not None:
+            mask &= otm_distance >= -self._atm_tol_pct * underlying_price
+        if self._max_otm_pct is not None:
+            mask &= otm_distance <= self._max_otm_pct * underlying_price
+
+        candidate_idx = np.flatnonzero(mask)
+        if candidate_idx.size == 0:
             logger.error(f"❌ No valid options found for {symbol} {direction.upper()}")
             return None
 
-        logger.info(f"   Found {len(candidates)} valid {direction.upper()} options")
-        
-        # Sort by: 1) Nearest expiration, 2) Closest to ATM
-        candidates.sort(key=lambda opt: (opt["dte"], opt["strike_distance"]))
-        
-        best = candidates[0]
+        logger.info(f"   Found {candidate_idx.size} valid {direction.upper()} options")
+        
+        # Best = 1) nearest expiration, 2) closest to ATM; two linear min passes, no sort
+        candidate_dte = dte[candidate_idx]
+        nearest_expiry_idx = candidate_idx[candidate_dte == candidate_dte.min()]
+        i = nearest_expiry_idx[np.argmin(strike_distance[nearest_expiry_idx])]
+        best = {
+            "symbol": arrays["symbol"][i],
+            "strike": float(arrays["strike"][i]),
+            "expiration": arrays["expiration"][i],
+            "price": float(price[i]),
+            "dte": float(dte[i]),
+            "strike_distance": float(strike_distance[i]),
+        }
         logger.info(f"✅ Selected option: {best['symbol']}")
         logger.info(f"   Strike: ${best['strike']:.2f} (${best['strike_distance']:.2f} from ATM)")
         logger.info(f"   Expiration: {best['expiration'][:10]} (DTE: {best['dte']:.1f})")
         logger.info(f"   Price: ${best['price']:.2f}")
         
-        return best
-
-
-    def _infer_option_price(self, option: Dict[str, Any]) -> Optional[float]:
-        ask = option.get("ask_price")
-        bid = option.get("bid_price")
-        last = option.get("last_price") or option.get("last_trade_price")
-        if ask is not None and bid is not None and ask > 0 and bid > 0:
-            return float((ask + bid) / 2)
-        if ask is not None and ask > 0:
-            return float(ask)
-        if bid is not None and bid > 0:
-            return float(bid)
-        if last is not None and last > 0:
-            return float(last)
-        return None
+        now = time.monotonic()
+        # Drop expired picks so the cache stays as small as the burst it serves
+        self._contract_cache = {
+            key: entry for key, entry in self._contract_cache.items()
+            if now - entry[0] < CONTRACT_CACHE_TTL_SECONDS
+        }
+        self._contract_cache[cache_key] = (now, best)
+        return dict(best)
+
+    @staticmethod
+    def _chain_to_arrays(chain: List[Any]) -> Dict[str, np.ndarray]:
+        """Turn chain records into column arrays; missing numbers become NaN."""
+        n = len(chain)
+        type_code = np.zeros(n, dtype=np.uint8)
+        strike = np.full(n, np.nan)
+        expiration_ts = np.full(n, np.nan)
+        ask = np.full(n, np.nan)
+        bid = np.full(n, np.nan)
+        last = np.full(n, np.nan)
+        symbols = np.empty(n, dtype=object)
+        expirations = np.empty(n, dtype=object)
+
+        for i, option in enumerate(chain):
+            option_type = str(option.get("type") or option.get("option_type") or "").lower()
+            type_code[i] = OPTION_TYPE_CODES.get(option_type, 0)
+            strike_raw = option.get("strike") or option.get("strike_price")
+            if strike_raw is not None:
+                strike[i] = float(strike_raw)
+            expiration_raw = option.get("expiration") or option.get("expiration_date")
+            if expiration_raw:
+                expiration_ts[i] = _expiration_timestamp(expiration_raw)
+            for column, value in (
+                (ask, option.get("ask_price")),
+                (bid, option.get("bid_price")),
+                (last, option.get("last_price") or option.get("last_trade_price")),
+            ):
+                if value is not None:
+                    column[i] = float(value)
+            symbols[i] = option.get("symbol")
+            expirations[i] = expiration_raw
+
+        return {
+            "type_code": type_code,
+            "strike": strike,
+            "expiration_ts": expiration_ts,
+            "ask": ask,
+            "bid": bid,
+            "last": last,
+            "symbol": symbols,
+            "expiration": expirations,
+        }
+
+    @staticmethod
+    def _infer_option_prices(ask: np.ndarray, bid: np.ndarray, last: np.ndarray) -> np.ndarray:
+        """Bid/ask mid, else ask, else bid, else last trade; NaN when none is positive."""
+        with np.errstate(invalid="ignore"):
+            return np.where(
+                (ask > 0) & (bid > 0), (ask + bid) / 2,
+                np.where(ask > 0, ask, np.where(bid > 0, bid, np.where(last > 0, last, np.nan))),
+            )
 
     def _calculate_contract_quantity(self, option_price: float) -> int:
         cash_available = self.broker.get_cash_balance()
-        max_risk_pct = self.config.get("trading", {}).get("max_risk_pct", 0.01)
-        risk_capital = cash_available * max_risk_pct
+        risk_capital = cash_available * self._max_risk_pct
         contract_cost = option_price * 100
         if contract_cost <= 0:
             return 0
         return int(risk_capital // contract_cost)
 
     def _wait_for_fill(self, order_id: Optional[str], timeout_seconds: int = 60) -> Optional[Dict[str, Any]]:
+        """Block until the monitor tick sees ``order_id`` reach a final state.
+
+        The order is registered in ``self._pending_fills`` and resolved by
+        ``_poll_pending_fills``, so fills and positions share one broker-polling
+        cadence instead of a dedicated loop per order.
+        """
         if not order_id:
             return None
-        deadline = time.time() + timeout_seconds
-        while time.time() < deadline:
-            order = self.broker.get_order(order_id)
-            if order.get("status") == "filled":
-                return order
-            time.sleep(2)
+        entry = {"event": threading.Event(), "order": None}
+        with self._pending_fills_lock:
+            self._pending_fills[order_id] = entry
+        try:
+            if entry["event"].wait(timeout_seconds):
+                return entry["order"]
+        finally:
+            with self._pending_fills_lock:
+                self._pending_fills.pop(order_id, None)
         return self.broker.get_order(order_id)
 
+    def _poll_pending_fills(self) -> None:
+        """Check every order awaiting a fill once and wake the threads whose order is final."""
+        with self._pending_fills_lock:
+            pending = list(self._pending_fills.items())
+        for order_id, entry in pending:
+            try:
+                order = self.broker.get_order(order_id)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to poll order %s: %s", order_id, exc)
+                continue
+            if order.get("status") in TERMINAL_ORDER_STATUSES:
+                entry["order"] = order
+                entry["event"].set()
+
 
     def _record_error(self, context: str) -> None:
         """Record an error and check circuit breaker."""
-        self.error_window.append(time.time())
+        now = time.time()
+        self.error_window.append(now)
+        self._prune_error_window(now)
         
-        # Check if we should trip the circuit breaker
+        # Trip when too many errors landed inside the sliding window
         if len(self.error_window) >= self.circuit_breaker_threshold:
-            # Check if all errors occurred within last 5 minutes
-            time_span = self.error_window[-1] - self.error_window[0]
-            if time_span < 300:  # 5 minutes
-                self.circuit_open = True
-                logger.error("Circuit breaker tripped! Too many errors in %s context", context)
-                self.notifier.send(
-                    "⚠️ **CIRCUIT BREAKER ACTIVATED** ⚠️\n"
-                    f"Context: {context}\n"
-                    "Bot operations paused for safety. Manual intervention required."
-                )
+            self.circuit_open = True
+            logger.error("Circuit breaker tripped! Too many errors in %s context", context)
+            self.notifier.send(
+                "⚠️ **CIRCUIT BREAKER ACTIVATED** ⚠️\n"
+                f"Context: {context}\n"
+                "Bot operations paused for safety. Manual intervention required."
+            )
+    
+    def _prune_error_window(self, now: float) -> None:
+        """Drop error timestamps older than the circuit breaker window."""
+        while self.error_window and now - self.error_window[0] >= CIRCUIT_BREAKER_WINDOW_SECONDS:
+            self.error_window.popleft()
     
     def health_check(self) -> Dict[str, Any]:
         """Perform health check and return status."""
+        self._prune_error_window(time.time())
         status = {
             "healthy": True,
             "circuit_open": self.circuit_open,
@@ -807,7 +1310,10 @@ class ScalpingBot:
         """Start web dashboard in background thread."""
         def run_dashboard():
             logger.info("Starting web dashboard on port 8001")
-            app.run(host='0.0.0.0', port=8001, debug=False, use_reloader=False)
+            if WAITRESS_AVAILABLE:
+                waitress_serve(app, host='0.0.0.0', port=8001, threads=8, _quiet=True)
+            else:
+                app.run(host='0.0.0.0', port=8001, debug=False, use_reloader=False, threaded=True)
         
         dashboard_thread = threading.Thread(target=run_dashboard, daemon=True)
         dashboard_thread.start()
@@ -827,6 +1333,7 @@ def index():
 
 
 @app.route('/api/status')
+@cached_response('status', ttl_seconds=3)
 def api_status():
     """Get current bot status and overview."""
     bot = ScalpingBot._instance
@@ -875,19 +1382,18 @@ def api_status():
     active_tickers = state.get('active_tickers', [])
     
     # Today's trades
-    from pathlib import Path
-    from datetime import datetime
     today_trades = []
     try:
-        csv_path = Path('data/trades.csv')
-        if csv_path.exists():
-            df = pd.read_csv(csv_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        if os.path.exists(TRADES_CSV_PATH):
             today = datetime.now(EASTERN_TZ).date()
-            today_df = df[df['timestamp'].dt.date == today]
-            today_trades = today_df.to_dict('records')
+            today_trades = _todays_trades(TRADES_CSV_PATH, today.isoformat())
+            if today_trades is None:
+                frames = _load_trades_frames()
+                df, chart = frames
+                today_start = EASTERN_TZ.localize(datetime.combine(today, dt_time()))
+                today_trades = _frame_records(_trades_since(chart, today_start)[df.columns])
     except Exception:
-        pass
+        today_trades = []
     
     # Get watchlist symbols
     watchlist_symbols = bot.config.get('watchlist', {}).get('symbols', [])
@@ -916,42 +1422,13 @@ def api_status():
 
 
 @app.route('/api/performance')
+@cached_response('performance', ttl_seconds=5)
 def api_performance():
     """Get performance statistics."""
-    from pathlib import Path
     try:
-        csv_path = Path('data/trades.csv')
-        if not csv_path.exists():
-            return jsonify({'total_trades': 0})
-        
-        df = pd.read_csv(csv_path)
-        if len(df) == 0:
-            return jsonify({'total_trades': 0})
-        
-        total_trades = len(df)
-        wins = len(df[df['pnl_pct'] > 0])
-        losses = len(df[df['pnl_pct'] < 0])
-        win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
-        
-        avg_win = df[df['pnl_pct'] > 0]['pnl_pct'].mean() if wins > 0 else 0
-        avg_loss = df[df['pnl_pct'] < 0]['pnl_pct'].mean() if losses > 0 else 0
-        avg_pnl = df['pnl_pct'].mean()
-        total_pnl = df['pnl_pct'].sum()
-        best_trade = df['pnl_pct'].max()
-        worst_trade = df['pnl_pct'].min()
-        
-        return jsonify({
-            'total_trades': int(total_trades),
-            'wins': int(wins),
-            'losses': int(losses),
-            'win_rate': float(win_rate),
-            'avg_win': float(avg_win),
-            'avg_loss': float(avg_loss),
-            'avg_pnl': float(avg_pnl),
-            'total_pnl': float(total_pnl),
-            'best_trade': float(best_trade),
-            'worst_trade': float(worst_trade),
-        })
+        # Running aggregates; only rows appended since the last request are parsed
+        _trade_stats.refresh()
+        return jsonify(_trade_stats.snapshot())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -959,20 +1436,38 @@ def api_performance():
 @app.route('/api/logs')
 def api_logs():
     """Get recent log lines."""
-    from pathlib import Path
     lines = int(request.args.get('lines', 30))
     try:
         log_path = Path('logs/bot.log')
         if not log_path.exists():
             return jsonify([])
         
-        with open(log_path, 'r') as f:
-            all_lines = f.readlines()
-            return jsonify(all_lines[-lines:])
+        return jsonify(_tail_lines(log_path, lines))
     except Exception:
         return jsonify([])
 
 
+def _tail_lines(path, count: int, block_size: int = 8192) -> List[str]:
+    """Return the last ``count`` lines of ``path`` (newlines kept), reading only the tail."""
+    if count <= 0:
+        return []
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        window = min(end, max(count * 200, block_size))
+        while True:
+            f.seek(end - window)
+            data = f.read(window)
+            # One extra line guards against starting mid-line; grow until that holds
+            if data.count(b'\n') > count or window == end:
+                break
+            window = min(end, window * 2)
+    lines = data.decode('utf-8', 'replace').splitlines(keepends=True)
+    if window < end:
+        lines = lines[1:]
+    return lines[-count:]
+
+
 @app.route('/api/controls/pause', methods=['POST'])
 def api_pause():
     """Pause automated trading."""
@@ -1036,6 +1531,16 @@ def api_news():
         return jsonify({'error': str(e)}), 500
 
 
+# Days from each weekday (Mon..Sun) to the next weekday session, indexed by whether
+# today's session time has already passed
+_DAYS_TO_NEXT_WEEKDAY = ((0, 1), (0, 1), (0, 1), (0, 1), (0, 3), (2, 2), (1, 1))
+
+
+def _session_time(now: datetime, days_ahead: int, at: dt_time) -> datetime:
+    """Eastern datetime ``days_ahead`` calendar days after ``now`` at wall-clock ``at``."""
+    return EASTERN_TZ.localize(datetime.combine(now.date() + timedelta(days=days_ahead), at))
+
+
 @app.route('/api/market_status')
 def api_market_status():
     """Get market status and timing information."""
@@ -1049,29 +1554,12 @@ def api_market_status():
     # Calculate next market open
     next_open = None
     if not is_open:
-        next_day = now
-        while True:
-            # Move to next day if after market close or weekend
-            if next_day.weekday() >= 5 or next_day.hour >= 16:
-                next_day = next_day.replace(hour=9, minute=30, second=0, microsecond=0)
-                next_day += timedelta(days=1)
-            else:
-                next_day = next_day.replace(hour=9, minute=30, second=0, microsecond=0)
-            
-            # Skip weekends
-            while next_day.weekday() >= 5:
-                next_day += timedelta(days=1)
-            
-            break
-        
-        next_open = next_day.isoformat()
+        after_close = now.hour >= MARKET_CLOSE_TIME.hour
+        next_open = _session_time(now, _DAYS_TO_NEXT_WEEKDAY[now.weekday()][after_close], MARKET_OPEN_TIME).isoformat()
     
-    # Next scan time (8:30 AM ET tomorrow if it's a weekday)
-    next_scan = now.replace(hour=8, minute=30, second=0, microsecond=0)
-    if now.hour >= 8 and now.minute >= 30:
-        next_scan += timedelta(days=1)
-    while next_scan.weekday() >= 5:
-        next_scan += timedelta(days=1)
+    # Next scan time (8:30 AM ET, today if not yet passed, on a weekday)
+    scan_passed = now.time() >= PREMARKET_SCAN_TIME
+    next_scan = _session_time(now, _DAYS_TO_NEXT_WEEKDAY[now.weekday()][scan_passed], PREMARKET_SCAN_TIME)
     
     return jsonify({
         'market_open': is_open,
@@ -1083,38 +1571,29 @@ def api_market_status():
 
 
 @app.route('/api/chart_data')
+@cached_response('chart_data', ttl_seconds=5)
 def api_chart_data():
     """Get performance chart data."""
-    from pathlib import Path
     try:
-        csv_path = Path('data/trades.csv')
-        if not csv_path.exists():
+        # Sorted by time with cumulative P/L and day number precomputed (cached on file mtime)
+        frames = _load_trades_frames()
+        if frames is None:
             return jsonify({'trades': [], 'equity_curve': []})
         
-        df = pd.read_csv(csv_path)
+        df = frames[1]
         if len(df) == 0:
             return jsonify({'trades': [], 'equity_curve': []})
         
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.sort_values('timestamp')
-        
-        # Calculate cumulative P/L for equity curve
-        df['cumulative_pnl'] = df['pnl_pct'].cumsum()
-        
         # Last 30 days of data
         cutoff = datetime.now(EASTERN_TZ) - timedelta(days=30)
-        recent_df = df[df['timestamp'] > cutoff]
+        recent_df = _trades_since(df, cutoff, inclusive=False)
         
-        equity_curve = recent_df[['timestamp', 'cumulative_pnl']].to_dict('records')
+        equity_curve = _frame_records(recent_df[['timestamp', 'cumulative_pnl']])
         
         # Group by day for daily P/L
-        recent_df['date'] = recent_df['timestamp'].dt.date.astype(str)
-        daily_pnl = recent_df.groupby('date')['pnl_pct'].sum().reset_index()
-        daily_pnl.columns = ['date', 'pnl']
-        
         return jsonify({
             'equity_curve': equity_curve,
-            'daily_pnl': daily_pnl.to_dict('records')
+            'daily_pnl': _daily_pnl(recent_df['day'].to_numpy(), recent_df['pnl_pct'].to_numpy(dtype=float)),
         })
     except Exception as e:
         logger.error("Error generating chart data: %s", e)
@@ -1202,12 +1681,10 @@ def api_add_to_watchlist():
     
     # Save to config file
     try:
-        import yaml
-        with open('config.yaml', 'w') as f:
-            yaml.dump(bot.config, f, default_flow_style=False)
+        save_config(bot.config)
+        invalidate_response('status')
         
         logger.info("Added %s to watchlist", ticker)
-        from datetime import datetime
         embed = {
             "title": "✅ Watchlist Updated",
             "description": f"Added **{ticker}** to watchlist",
@@ -1254,12 +1731,10 @@ def api_remove_from_watchlist():
     
     # Save to config file
     try:
-        import yaml
-        with open('config.yaml', 'w') as f:
-            yaml.dump(bot.config, f, default_flow_style=False)
+        save_config(bot.config)
+        invalidate_response('status')
         
         logger.info("Removed %s from watchlist", ticker)
-        from datetime import datetime
         embed = {
             "title": "🗑️ Watchlist Updated",
             "description": f"Removed **{ticker}** from watchlist",
@@ -1293,13 +1768,13 @@ def api_update_settings():
     data = request.get_json()
     
     try:
-        import yaml
-        
         # Update trading settings
         if 'trading' in data:
             if 'trading' not in bot.config:
                 bot.config['trading'] = {}
             bot.config['trading'].update(data['trading'])
+            bot._load_trading_settings()
+            bot.monitor.load_exit_settings()
         
         # Update signal settings
         if 'signals' in data:
@@ -1308,8 +1783,8 @@ def api_update_settings():
             bot.config['signals'].update(data['signals'])
         
         # Save to config file
-        with open('config.yaml', 'w') as f:
-            yaml.dump(bot.config, f, default_flow_style=False)
+        save_config(bot.config)
+        invalidate_response('status')
         
         logger.info("Settings updated successfully")
         bot.notifier.send("⚙️ **Settings Updated**\nConfiguration changes saved and applied.")
@@ -1323,6 +1798,81 @@ def api_update_settings():
         return jsonify({'error': 'Failed to save settings'}), 500
 
 
+WEBHOOK_HASH_CHUNK_BYTES = 64 * 1024
+
+# At most one deploy waits behind the running one; its git pull picks up every later push
+_deploy_queue: "queue.Queue[Any]" = queue.Queue(maxsize=1)
+_deploy_worker: Optional[threading.Thread] = None
+_deploy_worker_lock = threading.Lock()
+
+
+def _enqueue_deploy(bot: Any) -> bool:
+    """Queue a pull-and-restart on the deploy worker; False if one is already pending."""
+    global _deploy_worker
+    with _deploy_worker_lock:
+        if _deploy_worker is None or not _deploy_worker.is_alive():
+            _deploy_worker = threading.Thread(target=_deploy_loop, name="deploy-worker", daemon=True)
+            _deploy_worker.start()
+    try:
+        _deploy_queue.put_nowait(bot)
+        return True
+    except queue.Full:
+        return False
+
+
+def _deploy_loop() -> None:
+    while True:
+        bot = _deploy_queue.get()
+        try:
+            _run_deploy(bot)
+        finally:
+            _deploy_queue.task_done()
+
+
+def _run_deploy(bot: Any) -> None:
+    """git pull the checkout and restart the service, reporting each step to Discord."""
+    try:
+        # Git pull
+        result = subprocess.run(
+            ['git', 'pull', 'origin', 'main'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        
+        if result.returncode == 0:
+            logger.info(f"✅ Git pull successful: {result.stdout}")
+            bot.notifier.send(f"✅ **Code Updated**\n```\n{result.stdout}\n```")
+            
+            # Restart service
+            logger.info("🔄 Restarting service...")
+            subprocess.run(
+                ['sudo', 'systemctl', 'restart', 'scalp-bot'],
+                timeout=30
+            )
+            logger.info("✅ Service restart initiated")
+            bot.notifier.send("🎉 **Auto-Deploy Complete**\nBot is restarting with new code!")
+        else:
+            logger.error(f"❌ Git pull failed: {result.stderr}")
+            bot.notifier.send(f"❌ **Deploy Failed**\n```\n{result.stderr}\n```")
+    except Exception as e:
+        logger.error(f"❌ Deploy error: {e}")
+        bot.notifier.send(f"❌ **Deploy Error**\n```\n{str(e)}\n```")
+
+
+def _webhook_signature(mac: "hmac.HMAC", body: bytes) -> str:
+    """GitHub-style ``sha256=<hex>`` HMAC of ``body``, fed in chunks through a memoryview.
+
+    ``mac`` is a keyed template; it is copied so the key setup is not repeated.
+    """
+    mac = mac.copy()
+    view = memoryview(body)
+    for start in range(0, len(view), WEBHOOK_HASH_CHUNK_BYTES):
+        mac.update(view[start:start + WEBHOOK_HASH_CHUNK_BYTES])
+    return "sha256=" + mac.hexdigest()
+
+
 @app.route('/webhook', methods=['POST'])
 def github_webhook():
     """Handle GitHub webhook for auto-deploy."""
@@ -1331,22 +1881,14 @@ def github_webhook():
         if not bot:
             return jsonify({'error': 'Bot not initialized'}), 503
         
-        # Get secret from config
-        secret = bot.config.get('webhook_secret', '')
-        
-        if not secret:
+        if bot._webhook_mac is None:
             logger.warning("Webhook secret not configured in config.yaml")
             return jsonify({'error': 'Webhook not configured'}), 500
         
         # Verify signature
         signature = request.headers.get('X-Hub-Signature-256')
         if signature:
-            hash_object = hmac.new(
-                secret.encode('utf-8'),
-                msg=request.data,
-                digestmod=hashlib.sha256
-            )
-            expected_signature = "sha256=" + hash_object.hexdigest()
+            expected_signature = _webhook_signature(bot._webhook_mac, request.get_data(cache=True))
             
             if not hmac.compare_digest(expected_signature, signature):
                 logger.warning("Invalid webhook signature")
@@ -1376,39 +1918,9 @@ def github_webhook():
                 # Send Discord notification
                 bot.notifier.send(f"🔄 **Auto-Deploy Started**\nPushed by: {pusher}\nCommits: {len(commits)}")
                 
-                # Run git pull and restart in background
-                def deploy():
-                    try:
-                        # Git pull
-                        result = subprocess.run(
-                            ['git', 'pull', 'origin', 'main'],
-                            cwd=os.path.dirname(os.path.abspath(__file__)),
-                            capture_output=True,
-                            text=True,
-                            timeout=30
-                        )
-                        
-                        if result.returncode == 0:
-                            logger.info(f"✅ Git pull successful: {result.stdout}")
-                            bot.notifier.send(f"✅ **Code Updated**\n```\n{result.stdout}\n```")
-                            
-                            # Restart service
-                            logger.info("🔄 Restarting service...")
-                            subprocess.run(
-                                ['sudo', 'systemctl', 'restart', 'scalp-bot'],
-                                timeout=30
-                            )
-                            logger.info("✅ Service restart initiated")
-                            bot.notifier.send("🎉 **Auto-Deploy Complete**\nBot is restarting with new code!")
-                        else:
-                            logger.error(f"❌ Git pull failed: {result.stderr}")
-                            bot.notifier.send(f"❌ **Deploy Failed**\n```\n{result.stderr}\n```")
-                    except Exception as e:
-                        logger.error(f"❌ Deploy error: {e}")
-                        bot.notifier.send(f"❌ **Deploy Error**\n```\n{str(e)}\n```")
-                
-                # Run in background thread
-                threading.Thread(target=deploy, daemon=True).start()
+                # Hand off to the single deploy worker; pushes during a pending deploy coalesce
+                if not _enqueue_deploy(bot):
+                    logger.info("Deploy already pending - this push will be included")
                 
                 return jsonify({
                     'message': 'Deploy started',
@@ -1440,8 +1952,6 @@ def webhook_health():
 
 def main() -> None:
     """Main entry point for the bot."""
-    import atexit
-    
     try:
         bot = ScalpingBot()
         
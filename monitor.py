@@ -1,12 +1,22 @@
 import logging
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from broker import BrokerClient
 from notifications import DiscordNotifier
 from signals import SignalDetector
 from utils import EASTERN_TZ, ensure_timezone, minutes_between, read_state, update_state, append_trade_log
 
+try:
+    from alpaca.data.live.option import OptionDataStream
+except ImportError:  # older alpaca-py without option streaming
+    OptionDataStream = None
+
+# Streamed quotes older than this fall back to a REST quote
+STREAM_PRICE_MAX_AGE_SECONDS = 10.0
+
 
 class PositionMonitor:
     """Monitors open option positions and enforces exit rules."""
@@ -24,11 +34,65 @@ class PositionMonitor:
         self.config = config
         self.trading_cfg = config.get("trading", {})
         self.logger = logging.getLogger(__name__)
+        # option symbol -> (monotonic time, mid price), pushed by the quote stream
+        self._last_price: Dict[str, Tuple[float, float]] = {}
+        self._stream: Optional[Any] = None
+        self._stream_symbol: Optional[str] = None
+        self._stream_lock = threading.Lock()
+        self.load_exit_settings()
+
+    def load_exit_settings(self) -> None:
+        """Precompute exit thresholds; call again whenever config['trading'] changes."""
+        self.trading_cfg = self.config.get("trading", {})
+        self._profit_target_pct = self.trading_cfg.get("profit_target_pct", 0.15) * 100
+        self._stop_loss_pct = self.trading_cfg.get("stop_loss_pct", 0.07) * 100
+        self._timeout_minutes = self.trading_cfg.get("timeout_seconds", 300) / 60.0
+        eod_hour, eod_minute = map(int, self.trading_cfg.get("end_of_day_exit", "15:55").split(":"))
+        self._eod_minutes = eod_hour * 60 + eod_minute
+        self._stream_prices = bool(self.trading_cfg.get("stream_option_prices", False)) and OptionDataStream is not None
+
+    def watch_option(self, option_symbol: str) -> None:
+        """Subscribe to pushed quotes for the open contract (only with trading.stream_option_prices)."""
+        if not self._stream_prices:
+            return
+        with self._stream_lock:
+            if self._stream_symbol == option_symbol:
+                return
+            try:
+                if self._stream_symbol:
+                    self._stream.unsubscribe_quotes(self._stream_symbol)
+                    self._last_price.pop(self._stream_symbol, None)
+                    self._stream_symbol = None
+                if self._stream is None:
+                    # The stream's run loop waits for a subscription, so subscribe before starting it
+                    self._stream = OptionDataStream(self.broker.api_key_id, self.broker.api_secret_key)
+                    self._stream.subscribe_quotes(self._on_quote, option_symbol)
+                    threading.Thread(target=self._stream.run, name="option-quotes", daemon=True).start()
+                else:
+                    self._stream.subscribe_quotes(self._on_quote, option_symbol)
+                self._stream_symbol = option_symbol
+            except Exception as exc:  # noqa: BLE001
+                self.logger.warning("Option quote stream unavailable for %s: %s", option_symbol, exc)
+
+    async def _on_quote(self, quote: Any) -> None:
+        # Zero bid/ask means no quote on that side (common on thin 0DTE contracts)
+        price = BrokerClient._mid_price(quote.ask_price or None, quote.bid_price or None, None)
+        if price is not None:
+            self._last_price[quote.symbol] = (time.monotonic(), price)
+
+    def _current_price(self, option_symbol: str) -> Optional[float]:
+        """Latest streamed mid price when fresh, otherwise a REST quote."""
+        if self._stream_prices:
+            self.watch_option(option_symbol)
+            entry = self._last_price.get(option_symbol)
+            if entry and time.monotonic() - entry[0] < STREAM_PRICE_MAX_AGE_SECONDS:
+                return entry[1]
+        return self.broker.get_option_market_price(option_symbol)
 
     def evaluate(self) -> None:
         self.logger.info("👀 Checking for open positions...")
-        state = read_state()
-        position_state = state.get("open_position")
+        # Read-only snapshot: exits persist through update_state() below
+        position_state = read_state(deep_copy=False).get("open_position")
         if not position_state:
             self.logger.info("✅ No open positions to monitor")
             return
@@ -42,7 +106,7 @@ class PositionMonitor:
 
         self.logger.info(f"📊 Monitoring {ticker} {option_symbol}: {contracts} contracts @ ${entry_price:.2f}")
         
-        current_price = self.broker.get_option_market_price(option_symbol)
+        current_price = self._current_price(option_symbol)
         if current_price is None:
             self.logger.warning(f"⚠️ No option price available for {option_symbol}")
             return
@@ -52,11 +116,14 @@ class PositionMonitor:
         
         self.logger.info(f"💰 Current P/L: {pnl_pct:+.2f}% (${pnl_dollar:+.2f}) | Price: ${current_price:.2f}")
 
+        # One clock sample per tick, shared by the exit rules, trade log and alert
+        now = datetime.now(EASTERN_TZ)
         reason = self._exit_reason(
             ticker=ticker,
             direction=direction,
             entry_time=entry_time,
             pnl_pct=pnl_pct,
+            now=now,
         )
         if not reason:
             return
@@ -66,8 +133,9 @@ class PositionMonitor:
         )
         self._close_position(option_symbol, contracts)
 
+        now_iso = now.isoformat()
         trade_record = {
-            "timestamp": datetime.now(EASTERN_TZ).isoformat(),
+            "timestamp": now_iso,
             "ticker": ticker,
             "direction": direction,
             "strike": position_state.get("strike"),
@@ -87,10 +155,10 @@ class PositionMonitor:
             exit_price=current_price,
             pnl_pct=pnl_pct,
             reason=reason,
+            timestamp=now_iso,
         )
 
-        state["open_position"] = None
-        update_state(state)
+        update_state({"open_position": None})
 
     # -------------------- Helpers --------------------
     def _exit_reason(
@@ -99,27 +167,21 @@ class PositionMonitor:
         direction: str,
         entry_time: datetime,
         pnl_pct: float,
+        now: datetime,
     ) -> Optional[str]:
-        profit_target_pct = self.trading_cfg.get("profit_target_pct", 0.15) * 100
-        stop_loss_pct = self.trading_cfg.get("stop_loss_pct", 0.07) * 100
-        timeout_seconds = self.trading_cfg.get("timeout_seconds", 300)
-        end_of_day_exit = self.trading_cfg.get("end_of_day_exit", "15:55")
-
-        now = datetime.now(EASTERN_TZ)
         elapsed_minutes = minutes_between(entry_time, now)
 
-        if pnl_pct >= profit_target_pct:
+        # Plain comparisons first; the indicator-based reversal check runs only if none fired
+        if pnl_pct >= self._profit_target_pct:
             return "profit target"
-        if pnl_pct <= -stop_loss_pct:
+        if pnl_pct <= -self._stop_loss_pct:
             return "stop loss"
-        if self.signal_detector.has_reversal(ticker, direction):
-            return "ema reversal"
-        if elapsed_minutes * 60 >= timeout_seconds:
+        if elapsed_minutes >= self._timeout_minutes:
             return "timeout"
-
-        eod_hour, eod_minute = map(int, end_of_day_exit.split(":"))
-        if now.hour > eod_hour or (now.hour == eod_hour and now.minute >= eod_minute):
+        if now.hour * 60 + now.minute >= self._eod_minutes:
             return "end of day"
+        if self.signal_detector.has_reversal(ticker, direction):
+            return "ema reversal"
         return None
 
     def _close_position(self, option_symbol: str, contracts: int) -> None:
@@ -137,8 +199,7 @@ class PositionMonitor:
     
     def _force_close(self, reason: str = "manual_close") -> None:
         """Force close the current position immediately."""
-        state = read_state()
-        position_state = state.get("open_position")
+        position_state = read_state(deep_copy=False).get("open_position")
         if not position_state:
             return
         
@@ -149,7 +210,7 @@ class PositionMonitor:
         direction = position_state.get("direction")
         
         # Get current price
-        current_price = self.broker.get_option_market_price(option_symbol)
+        current_price = self._current_price(option_symbol)
         if current_price is None:
             current_price = entry_price  # Fallback to entry price
         
@@ -159,8 +220,9 @@ class PositionMonitor:
         self._close_position(option_symbol, contracts)
         
         # Log the trade
+        now_iso = datetime.now(EASTERN_TZ).isoformat()
         trade_record = {
-            "timestamp": datetime.now(EASTERN_TZ).isoformat(),
+            "timestamp": now_iso,
             "ticker": ticker,
             "direction": direction,
             "strike": position_state.get("strike"),
@@ -181,8 +243,8 @@ class PositionMonitor:
             exit_price=current_price,
             pnl_pct=pnl_pct,
             reason=reason,
+            timestamp=now_iso,
         )
         
         # Clear position from state
-        state["open_position"] = None
-        update_state(state)
+        update_state({"open_position": None})
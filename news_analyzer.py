@@ -4,14 +4,31 @@ AI-powered news analyzer for watchlist tickers.
 Fetches latest news and provides sentiment + trade likelihood analysis.
 """
 
+import hashlib
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import requests
+from requests.adapters import HTTPAdapter
 from openai import OpenAI
 
+from utils import CACHE_DIR, FileCache, TTLCache, chunk_list
+
 logger = logging.getLogger(__name__)
 
+# Alpaca news responses are reused from disk for this long
+NEWS_CACHE_TTL_SECONDS = 300
+# AI results for an identical set of articles are reused for this long
+ANALYSIS_CACHE_TTL_SECONDS = 300
+# Concurrent news fetch + AI calls per watchlist run (bounded for OpenAI rate limits)
+MAX_ANALYSIS_WORKERS = 8
+# Tickers analyzed per batched OpenAI request (keeps the JSON reply within max_tokens)
+ANALYSIS_BATCH_SIZE = 10
+ANALYSIS_TOKENS_PER_TICKER = 200
+SYSTEM_PROMPT = "You are a financial news analyst specializing in short-term trading opportunities. Be concise and actionable."
+
 
 class NewsAnalyzer:
     """Analyzes news for watchlist tickers using AI."""
@@ -21,6 +38,13 @@ class NewsAnalyzer:
         self.openai_api_key = config.get('openai', {}).get('api_key')
         self.alpaca_api_key = config.get('alpaca', {}).get(config.get('mode', 'paper'), {}).get('api_key_id')
         self.alpaca_secret = config.get('alpaca', {}).get(config.get('mode', 'paper'), {}).get('api_secret_key')
+        self.max_workers = max(1, int(config.get('openai', {}).get('max_concurrent_requests', MAX_ANALYSIS_WORKERS)))
+        # Shared keep-alive pool for the concurrent watchlist news fetches
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers))
+        self.news_cache = FileCache(CACHE_DIR / "news", default_ttl=NEWS_CACHE_TTL_SECONDS)
+        # (symbol, md5 of the news text) -> analysis
+        self.analysis_cache = TTLCache(ANALYSIS_CACHE_TTL_SECONDS)
         
         if self.openai_api_key:
             self.client = OpenAI(api_key=self.openai_api_key)
@@ -37,6 +61,11 @@ class NewsAnalyzer:
         if not self.alpaca_api_key:
             return []
         
+        cache_key = f"{symbol}|{hours}"
+        cached = self.news_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Calculate time range
             end = datetime.utcnow()
@@ -56,11 +85,12 @@ class NewsAnalyzer:
                 "sort": "desc"
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self._session.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             
             news_data = response.json()
             articles = news_data.get('news', [])
+            self.news_cache.set(cache_key, articles)
             
             return articles
             
@@ -68,6 +98,42 @@ class NewsAnalyzer:
             logger.error(f"Failed to fetch news for {symbol}: {e}")
             return []
     
+    @staticmethod
+    def _news_text(articles: List[Dict[str, Any]]) -> str:
+        """Numbered headline + summary block fed to the model."""
+        news_text = ""
+        for i, article in enumerate(articles[:5], 1):
+            headline = article.get('headline', '')
+            summary = article.get('summary', '')
+            news_text += f"{i}. {headline}\n{summary}\n\n"
+        return news_text
+    
+    @staticmethod
+    def _analysis_key(symbol: str, news_text: str) -> tuple:
+        return symbol, hashlib.md5(news_text.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _no_news_result(symbol: str) -> Dict[str, Any]:
+        return {
+            "symbol": symbol,
+            "summary": "No recent news",
+            "sentiment": "neutral",
+            "entry_likelihood": "low",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
+    @staticmethod
+    def _analysis_result(symbol: str, result: Dict[str, Any], news_count: int) -> Dict[str, Any]:
+        return {
+            "symbol": symbol,
+            "summary": result.get("summary", "No summary available"),
+            "sentiment": result.get("sentiment", "neutral"),
+            "entry_likelihood": result.get("entry_likelihood", "low"),
+            "reasoning": result.get("reasoning", ""),
+            "news_count": news_count,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
     def analyze_ticker_news(self, symbol: str, hours: int = 1) -> Optional[Dict[str, Any]]:
         """Analyze news for a single ticker using AI."""
         if not self.is_configured():
@@ -77,20 +143,15 @@ class NewsAnalyzer:
         articles = self.get_news_for_ticker(symbol, hours)
         
         if not articles:
-            return {
-                "symbol": symbol,
-                "summary": "No recent news",
-                "sentiment": "neutral",
-                "entry_likelihood": "low",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return self._no_news_result(symbol)
         
         # Prepare news text for AI
-        news_text = ""
-        for i, article in enumerate(articles[:5], 1):
-            headline = article.get('headline', '')
-            summary = article.get('summary', '')
-            news_text += f"{i}. {headline}\n{summary}\n\n"
+        news_text = self._news_text(articles)
+        
+        cache_key = self._analysis_key(symbol, news_text)
+        cached = self.analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         # AI prompt
         prompt = f"""Analyze the following news for {symbol} and provide:
@@ -113,26 +174,19 @@ Respond in this exact JSON format:
             response = self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "You are a financial news analyst specializing in short-term trading opportunities. Be concise and actionable."},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
-                max_tokens=200,
+                max_tokens=ANALYSIS_TOKENS_PER_TICKER,
                 response_format={"type": "json_object"}
             )
             
-            import json
             result = json.loads(response.choices[0].message.content)
             
-            return {
-                "symbol": symbol,
-                "summary": result.get("summary", "No summary available"),
-                "sentiment": result.get("sentiment", "neutral"),
-                "entry_likelihood": result.get("entry_likelihood", "low"),
-                "reasoning": result.get("reasoning", ""),
-                "news_count": len(articles),
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            analysis = self._analysis_result(symbol, result, len(articles))
+            self.analysis_cache.set(cache_key, analysis)
+            return analysis
             
         except Exception as e:
             logger.error(f"AI analysis failed for {symbol}: {e}")
@@ -144,22 +198,102 @@ Respond in this exact JSON format:
                 "timestamp": datetime.utcnow().isoformat()
             }
     
+    def _analyze_batch(self, batch: List[tuple]) -> Dict[str, Dict[str, Any]]:
+        """Analyze several tickers' news in one completion.
+        
+        ``batch`` holds ``(symbol, articles, news_text)`` tuples. Returns analyses for
+        the symbols the model answered well-formed; the caller retries the rest
+        one by one.
+        """
+        sections = "\n---\n".join(f"{symbol}:\n{news_text}" for symbol, _, news_text in batch)
+        prompt = f"""For each ticker below, analyze its news and provide:
+1. A 1-2 sentence summary of the key developments
+2. Overall sentiment (bullish/bearish/neutral)
+3. Likelihood of a good scalping entry in next few hours (high/medium/low)
+
+{sections}
+
+Respond with one JSON object keyed by ticker symbol, in this exact format:
+{{
+    "SYMBOL": {{
+        "summary": "1-2 sentence summary here",
+        "sentiment": "bullish/bearish/neutral",
+        "entry_likelihood": "high/medium/low",
+        "reasoning": "Brief reason for the likelihood"
+    }}
+}}"""
+        try:
+            response = self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=ANALYSIS_TOKENS_PER_TICKER * len(batch),
+                response_format={"type": "json_object"}
+            )
+            results = json.loads(response.choices[0].message.content)
+        except Exception as e:
+            logger.warning(f"Batched AI analysis failed for {len(batch)} tickers, retrying individually: {e}")
+            return {}
+        if not isinstance(results, dict):
+            return {}
+        
+        analyses = {}
+        for symbol, articles, news_text in batch:
+            result = results.get(symbol)
+            if not isinstance(result, dict) or not result.get("sentiment"):
+                continue
+            analysis = self._analysis_result(symbol, result, len(articles))
+            self.analysis_cache.set(self._analysis_key(symbol, news_text), analysis)
+            analyses[symbol] = analysis
+        return analyses
+    
     def analyze_watchlist(self, symbols: List[str], hours: int = 1) -> List[Dict[str, Any]]:
-        """Analyze news for all watchlist tickers."""
+        """Analyze news for all watchlist tickers.
+        
+        News is fetched concurrently; tickers with fresh news are then analyzed in
+        batched prompts, with a per-ticker request for any the batch missed.
+        """
         if not self.is_configured():
             logger.warning("News analyzer not configured")
             return []
         
         logger.info(f"Analyzing news for {len(symbols)} tickers...")
         
-        results = []
-        for symbol in symbols:
+        def analyze(symbol: str) -> Optional[Dict[str, Any]]:
             try:
-                analysis = self.analyze_ticker_news(symbol, hours)
-                if analysis:
-                    results.append(analysis)
+                return self.analyze_ticker_news(symbol, hours)
             except Exception as e:
                 logger.error(f"Error analyzing {symbol}: {e}")
+                return None
+        
+        analyses: Dict[str, Dict[str, Any]] = {}
+        # Each ticker is network-bound (Alpaca news + OpenAI), so run them side by side,
+        # never more than max_workers at once so large watchlists stay under rate limits
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(symbols)))) as executor:
+            pending = []
+            for symbol, articles in zip(symbols, executor.map(lambda s: self.get_news_for_ticker(s, hours), symbols)):
+                if not articles:
+                    analyses[symbol] = self._no_news_result(symbol)
+                    continue
+                news_text = self._news_text(articles)
+                cached = self.analysis_cache.get(self._analysis_key(symbol, news_text))
+                if cached is not None:
+                    analyses[symbol] = cached
+                else:
+                    pending.append((symbol, articles, news_text))
+            
+            if len(pending) > 1:
+                for batch_analyses in executor.map(self._analyze_batch, chunk_list(pending, ANALYSIS_BATCH_SIZE)):
+                    analyses.update(batch_analyses)
+            
+            missing = [symbol for symbol, _, _ in pending if symbol not in analyses]
+            for symbol, analysis in zip(missing, executor.map(analyze, missing)):
+                if analysis:
+                    analyses[symbol] = analysis
         
+        results = [analyses[symbol] for symbol in symbols if symbol in analyses]
         logger.info(f"Completed news analysis for {len(results)}/{len(symbols)} tickers")
         return results
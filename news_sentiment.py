@@ -5,12 +5,24 @@ Fetches and analyzes news for watchlist tickers.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 import json
 
+from utils import TTLCache, chunk_list
+
 logger = logging.getLogger(__name__)
 
+# Concurrent OpenAI requests per watchlist run (bounded for rate limits)
+MAX_ANALYSIS_WORKERS = 8
+# Repeat requests for a symbol within this window reuse the last result
+ANALYSIS_CACHE_TTL_SECONDS = 60
+# Tickers analyzed per batched OpenAI request (keeps the JSON reply within max_tokens)
+ANALYSIS_BATCH_SIZE = 10
+ANALYSIS_TOKENS_PER_TICKER = 150
+SYSTEM_PROMPT = "You are a financial analyst providing concise market sentiment analysis for day traders. You have access to current market news and data."
+
 
 class NewsSentimentAnalyzer:
     """Analyzes news sentiment for tickers using OpenAI."""
@@ -18,6 +30,9 @@ class NewsSentimentAnalyzer:
     def __init__(self, config: Dict):
         self.config = config
         self.openai_api_key = config.get('openai', {}).get('api_key')
+        self.max_workers = max(1, int(config.get('openai', {}).get('max_concurrent_requests', MAX_ANALYSIS_WORKERS)))
+        # symbol -> last successful analysis
+        self.analysis_cache = TTLCache(ANALYSIS_CACHE_TTL_SECONDS)
         
         if self.openai_api_key:
             try:
@@ -35,6 +50,15 @@ class NewsSentimentAnalyzer:
         """Check if analyzer is ready to use."""
         return self.client is not None
     
+    @staticmethod
+    def _analysis_result(symbol: str, result: Dict) -> Dict:
+        return {
+            'symbol': symbol,
+            'sentiment': result.get('sentiment', 'neutral').lower(),
+            'reasoning': result.get('reasoning', 'No analysis available'),
+            'timestamp': datetime.utcnow().isoformat()
+        }
+    
     def analyze_ticker(self, symbol: str) -> Optional[Dict]:
         """Analyze news sentiment for a single ticker using OpenAI.
         
@@ -47,6 +71,10 @@ class NewsSentimentAnalyzer:
         if not self.is_configured():
             return None
         
+        cached = self.analysis_cache.get(symbol)
+        if cached is not None:
+            return cached
+        
         try:
             # Prompt OpenAI to analyze recent news
             prompt = f"""Analyze the latest news and market sentiment for {symbol} stock.
@@ -68,7 +96,7 @@ Be concise and focus on actionable insights for day trading."""
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a financial analyst providing concise market sentiment analysis for day traders. You have access to current market news and data."
+                        "content": SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -76,18 +104,15 @@ Be concise and focus on actionable insights for day trading."""
                     }
                 ],
                 temperature=0.3,
-                max_tokens=150,
+                max_tokens=ANALYSIS_TOKENS_PER_TICKER,
                 response_format={"type": "json_object"}
             )
             
             result = json.loads(response.choices[0].message.content)
             
-            return {
-                'symbol': symbol,
-                'sentiment': result.get('sentiment', 'neutral').lower(),
-                'reasoning': result.get('reasoning', 'No analysis available'),
-                'timestamp': datetime.utcnow().isoformat()
-            }
+            analysis = self._analysis_result(symbol, result)
+            self.analysis_cache.set(symbol, analysis)
+            return analysis
             
         except Exception as e:
             logger.error(f"Failed to analyze {symbol}: {e}")
@@ -98,6 +123,61 @@ Be concise and focus on actionable insights for day trading."""
                 'timestamp': datetime.utcnow().isoformat()
             }
     
+    def _analyze_batch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Analyze several tickers in one completion.
+        
+        Returns analyses for the symbols the model answered well-formed; the
+        caller retries the rest one by one.
+        """
+        prompt = f"""Analyze the latest news and market sentiment for each of these stocks: {', '.join(symbols)}.
+
+For each ticker provide:
+1. Overall sentiment: bullish, bearish, or neutral
+2. Brief reasoning (1-2 sentences) based on recent news/events
+
+Respond with one JSON object keyed by ticker symbol, in this exact format:
+{{
+    "SYMBOL": {{
+        "sentiment": "bullish/bearish/neutral",
+        "reasoning": "Brief explanation here"
+    }}
+}}
+
+Be concise and focus on actionable insights for day trading."""
+        try:
+            response = self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=0.3,
+                max_tokens=ANALYSIS_TOKENS_PER_TICKER * len(symbols),
+                response_format={"type": "json_object"}
+            )
+            results = json.loads(response.choices[0].message.content)
+        except Exception as e:
+            logger.warning(f"Batched analysis failed for {len(symbols)} tickers, retrying individually: {e}")
+            return {}
+        if not isinstance(results, dict):
+            return {}
+        
+        analyses = {}
+        for symbol in symbols:
+            result = results.get(symbol)
+            if not isinstance(result, dict) or not isinstance(result.get('sentiment'), str):
+                continue
+            analysis = self._analysis_result(symbol, result)
+            self.analysis_cache.set(symbol, analysis)
+            analyses[symbol] = analysis
+        return analyses
+    
     def analyze_watchlist(self, symbols: List[str]) -> List[Dict]:
         """Analyze news sentiment for all watchlist tickers.
         
@@ -113,15 +193,39 @@ Be concise and focus on actionable insights for day trading."""
         
         logger.info(f"📰 Analyzing news sentiment for {len(symbols)} tickers...")
         
-        results = []
-        for symbol in symbols:
+        def analyze(symbol: str) -> Optional[Dict]:
             try:
-                analysis = self.analyze_ticker(symbol)
-                if analysis:
-                    results.append(analysis)
-                    logger.info(f"  ✅ {symbol}: {analysis['sentiment']} - {analysis['reasoning'][:50]}...")
+                return self.analyze_ticker(symbol)
             except Exception as e:
                 logger.error(f"  ❌ {symbol}: {e}")
+                return None
+        
+        by_symbol: Dict[str, Dict] = {}
+        pending = []
+        for symbol in symbols:
+            cached = self.analysis_cache.get(symbol)
+            if cached is not None:
+                by_symbol[symbol] = cached
+            else:
+                pending.append(symbol)
+        
+        # One prompt covers a batch of tickers; anything it misses gets its own request.
+        # Requests are network-bound, so run them side by side, at most max_workers at once.
+        # Cached symbols never reach the pool, so a repeat run may not need one at all.
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                if len(pending) > 1:
+                    for batch_analyses in executor.map(self._analyze_batch, chunk_list(pending, ANALYSIS_BATCH_SIZE)):
+                        by_symbol.update(batch_analyses)
+                missing = [symbol for symbol in pending if symbol not in by_symbol]
+                for symbol, analysis in zip(missing, executor.map(analyze, missing)):
+                    by_symbol[symbol] = analysis
+        
+        results = []
+        for analysis in (by_symbol.get(symbol) for symbol in symbols):
+            if analysis:
+                results.append(analysis)
+                logger.info(f"  ✅ {analysis['symbol']}: {analysis['sentiment']} - {analysis['reasoning'][:50]}...")
         
         logger.info(f"✅ Completed analysis for {len(results)}/{len(symbols)} tickers")
         return results
@@ -1,16 +1,132 @@
+import hashlib
+import json
 import logging
-from typing import Any, Dict, Optional
+import queue
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Discord accepts at most 10 embeds per webhook message
+MAX_EMBEDS_PER_MESSAGE = 10
+# ...and at most 6000 characters of embed text across the whole message
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+# How long the worker waits for more embed-only alerts to fold into one POST
+EMBED_BATCH_WINDOW_SECONDS = 0.5
+DEFAULT_DASHBOARD_URL = "http://localhost:8001"
+# Rate-limited (429) and 5xx posts are retried this many times before the alert is dropped
+MAX_POST_RETRIES = 3
+MAX_RETRY_AFTER_SECONDS = 60.0
+# Alerts buffered for the worker; when full the oldest is dropped so callers never block
+MAX_QUEUED_ALERTS = 256
+# Identical alerts repeated within this window are suppressed and reported once as a count
+DUPLICATE_WINDOW_SECONDS = 60.0
+MAX_RECENT_ALERTS = 256
+# How often an idle worker reports duplicates whose window has expired
+DUPLICATE_SWEEP_SECONDS = 5.0
+
+# Embed styling looked up once per alert: exit style indexed by (pnl_pct >= 0)
+_EXIT_STYLE = ((15158332, "⚠️", "LOSS"), (3066993, "🎉", "PROFIT"))  # red / green
+_SIGNAL_STYLE = {"call": (5763719, "📈"), "put": (15548997, "📉")}  # green / red
+_RANK_EMOJI = {1: "🥇", 2: "🥈"}
+# Compact, UTF-8 encoded bodies (emoji stay 4 bytes instead of 12-byte \u escapes)
+_encode_payload = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode
+
+
+def _dedup_view(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload minus per-call embed timestamps, so repeats of one alert hash identically."""
+    embeds = payload.get("embeds")
+    if not embeds:
+        return payload
+    return {**payload, "embeds": [{k: v for k, v in embed.items() if k != "timestamp"} for embed in embeds]}
+
+
+def _alert_label(payload: Dict[str, Any]) -> str:
+    embeds = payload.get("embeds")
+    if embeds and embeds[0].get("title"):
+        return embeds[0]["title"]
+    return (payload.get("content") or "alert")[:80]
 
 
 class DiscordNotifier:
-    """Simple Discord webhook integration for bot alerts."""
+    """Simple Discord webhook integration for bot alerts.
 
-    def __init__(self, config: Dict[str, Any]) -> None:
-        self.webhook_url = config.get('notifications', {}).get('discord_webhook_url')
-        self.dashboard_url = config.get('dashboard', {}).get('public_url', 'http://localhost:8001')
+    Messages are queued and posted by a background worker thread, so callers on
+    the trading and monitoring loops never wait on the webhook round-trip.
+    """
+
+    # Static embed scaffolding shared by every alert of a kind; each alert merges in
+    # its dynamic keys with {**skeleton, ...}. Fields lists are always built fresh
+    # because send() appends the dashboard link to them.
+    _TWEMOJI = "https://raw.githubusercontent.com/twitter/twemoji/master/assets/72x72/"
+    _SELECTION_SKELETON = {
+        "color": 5763719,  # Green
+        "thumbnail": {"url": _TWEMOJI + "1f4c8.png"},
+        "footer": {"text": "TARA | Pre-Market Scan Complete", "icon_url": _TWEMOJI + "1f916.png"},
+    }
+    _SIGNAL_SKELETON = {"footer": {"text": "Scalp Bot | Signal Generator"}}
+    _FILLED_SKELETON = {
+        "title": "✅ Order Filled",
+        "color": 3066993,  # Green
+        "footer": {"text": "Scalp Bot | Order Execution"},
+    }
+    _EXIT_SKELETON = {"footer": {"text": "Scalp Bot | Position Management"}}
+    _ERROR_SKELETON = {
+        "title": "🚨 Error Alert",
+        "color": 15158332,  # Red
+        "footer": {"text": "Scalp Bot | Error Handler"},
+    }
+    _STARTUP_SKELETON = {
+        "title": "✅ Bot Started Successfully",
+        "color": 3066993,  # Green
+        "thumbnail": {"url": _TWEMOJI + "2705.png"},
+        "footer": {"text": "TARA | Bot Initialized", "icon_url": _TWEMOJI + "1f916.png"},
+    }
+
+    def __init__(
+        self,
+        webhook_url: Optional[str] = None,
+        dashboard_url: str = DEFAULT_DASHBOARD_URL,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> None:
         self.logger = logging.getLogger(__name__)
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=MAX_QUEUED_ALERTS)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        # Only the worker thread posts, so one kept-alive connection to Discord is reused.
+        # The adapter retries only failed connects (nothing was sent yet); 429/5xx
+        # responses are retried by _post, which honours Retry-After.
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3),
+        ))
+        # payload hash -> [first_sent_monotonic, suppressed_count, label], oldest first
+        self._recent_hashes: "OrderedDict[str, list]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+        # (epoch second, ISO string) behind _get_timestamp
+        self._ts_cache: tuple = (None, "")
+        self.webhook_url = webhook_url
+        self.dashboard_url = dashboard_url
+        if config is not None:
+            self.refresh_config(config)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "DiscordNotifier":
+        """Build a notifier from the ``notifications`` and ``dashboard`` config sections."""
+        return cls(config=config)
+
+    def refresh_config(self, config: Dict[str, Any]) -> None:
+        """Re-read webhook and dashboard URLs in place so existing references stay valid."""
+        self.webhook_url = config.get('notifications', {}).get('discord_webhook_url')
+        self.dashboard_url = config.get('dashboard', {}).get('public_url', DEFAULT_DASHBOARD_URL)
 
     def is_configured(self) -> bool:
         return bool(self.webhook_url)
@@ -35,48 +151,205 @@ class DiscordNotifier:
                     })
             payload["embeds"] = embeds
 
-        try:
-            response = requests.post(self.webhook_url, json=payload, timeout=5)
-            if response.status_code >= 400:
-                self.logger.error(
-                    "Failed to post Discord message (%s): %s", response.status_code, response.text
-                )
-        except requests.RequestException as exc:
-            self.logger.exception("Error sending Discord notification: %s", exc)
+        if self._is_duplicate(payload):
+            self.logger.debug("Suppressing duplicate Discord alert: %s", message)
+            return
+        self._enqueue(payload)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Wait up to ``timeout`` for queued alerts, then release the pooled connections."""
+        self.flush(timeout=timeout)
+        self._session.close()
+
+    def _is_duplicate(self, payload: Dict[str, Any]) -> bool:
+        """Record ``payload`` and report whether an identical alert went out within the window."""
+        digest = hashlib.blake2b(_encode_payload(_dedup_view(payload)).encode("utf-8"), digest_size=8).hexdigest()
+        self._queue_suppressed_summaries()
+        with self._recent_lock:
+            entry = self._recent_hashes.get(digest)
+            if entry is not None:
+                entry[1] += 1
+            else:
+                self._recent_hashes[digest] = [time.monotonic(), 0, _alert_label(payload)]
+        return entry is not None
+
+    def _queue_suppressed_summaries(self, expired_only: bool = True) -> None:
+        """Queue a one-line summary for each alert that swallowed repeats.
+
+        Covers entries whose window has expired (which are evicted), or with
+        ``expired_only=False`` every entry, whose count is then reset.
+        """
+        for count, label in self._pop_suppressed(time.monotonic(), expired_only):
+            self._enqueue({"content": f"🔁 Suppressed {count} duplicate(s) of: {label}"})
+
+    def _pop_suppressed(self, now: float, expired_only: bool) -> List[Tuple[int, str]]:
+        suppressed = []
+        with self._recent_lock:
+            while self._recent_hashes:
+                oldest = next(iter(self._recent_hashes.values()))
+                if now - oldest[0] < DUPLICATE_WINDOW_SECONDS and len(self._recent_hashes) < MAX_RECENT_ALERTS:
+                    break
+                self._recent_hashes.popitem(last=False)
+                if oldest[1]:
+                    suppressed.append((oldest[1], oldest[2]))
+            if not expired_only:
+                for entry in self._recent_hashes.values():
+                    if entry[1]:
+                        suppressed.append((entry[1], entry[2]))
+                        entry[1] = 0
+        return suppressed
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued message has been posted; False if ``timeout`` expires first.
+
+        Pending duplicate counts are reported first, so nothing suppressed goes unmentioned.
+        """
+        self._queue_suppressed_summaries(expired_only=False)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _enqueue(self, payload: Dict[str, Any]) -> None:
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._drain, name="discord-notifier", daemon=True)
+                self._worker.start()
+        while True:
+            try:
+                self._queue.put_nowait(payload)
+                return
+            except queue.Full:
+                # Back-pressure: shed the stalest alert rather than stall the trading loop
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self._queue.task_done()
+                self.logger.warning("Discord alert queue full; dropped the oldest queued alert")
+
+    def _drain(self) -> None:
+        pending: Optional[Dict[str, Any]] = None
+        while True:
+            if pending is not None:
+                payload, pending = pending, None
+            else:
+                try:
+                    payload = self._queue.get(timeout=DUPLICATE_SWEEP_SECONDS)
+                except queue.Empty:
+                    # Idle: report storms that ended without a later alert to evict them
+                    self._queue_suppressed_summaries()
+                    continue
+            taken = 1
+            if self._is_embed_only(payload):
+                # Fold alerts raised in the same burst into one message
+                embeds = list(payload["embeds"])
+                chars = sum(map(self._embed_chars, embeds))
+                deadline = time.monotonic() + EMBED_BATCH_WINDOW_SECONDS
+                while len(embeds) < MAX_EMBEDS_PER_MESSAGE:
+                    try:
+                        following = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    following_chars = sum(map(self._embed_chars, following.get("embeds") or ()))
+                    if (
+                        self._is_embed_only(following)
+                        and len(embeds) + len(following["embeds"]) <= MAX_EMBEDS_PER_MESSAGE
+                        and chars + following_chars <= MAX_EMBED_CHARS_PER_MESSAGE
+                    ):
+                        embeds.extend(following["embeds"])
+                        chars += following_chars
+                        taken += 1
+                    else:
+                        pending = following
+                        break
+                payload = {"content": "", "embeds": embeds}
+            try:
+                self._post(payload)
+            except Exception as exc:  # keep the worker alive for later alerts
+                self.logger.exception("Unexpected error posting Discord notification: %s", exc)
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
+    @staticmethod
+    def _is_embed_only(payload: Dict[str, Any]) -> bool:
+        return not payload.get("content") and bool(payload.get("embeds"))
+
+    @staticmethod
+    def _embed_chars(embed: Dict[str, Any]) -> int:
+        """Characters Discord counts toward the per-message embed limit."""
+        total = len(embed.get("title", "")) + len(embed.get("description", ""))
+        total += len(embed.get("footer", {}).get("text", ""))
+        for field in embed.get("fields", ()):
+            total += len(field.get("name", "")) + len(field.get("value", ""))
+        return total
+
+    def _post(self, payload: Dict[str, Any]) -> None:
+        body = _encode_payload(payload).encode("utf-8")
+        for attempt in range(MAX_POST_RETRIES + 1):
+            try:
+                response = self._session.post(self.webhook_url, data=body, timeout=5)
+            except requests.RequestException as exc:
+                self.logger.exception("Error sending Discord notification: %s", exc)
+                return
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt == MAX_POST_RETRIES:
+                break
+            self.logger.warning(
+                "Discord returned %s; retrying in %.1fs (attempt %d/%d)",
+                response.status_code, delay, attempt + 1, MAX_POST_RETRIES,
+            )
+            # Sleeping on the worker thread delays only later alerts, never the caller
+            time.sleep(delay)
+        if response.status_code >= 400:
+            self.logger.error(
+                "Failed to post Discord message (%s): %s", response.status_code, response.text
+            )
+
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying ``response``, or None if it should not be retried."""
+        if response.status_code == 429:
+            try:
+                retry_after = float(response.headers.get("Retry-After", 1))
+            except (TypeError, ValueError):
+                retry_after = 1.0
+            return min(max(retry_after, 0.0), MAX_RETRY_AFTER_SECONDS)
+        if response.status_code >= 500:
+            return float(2 ** attempt)
+        return None
 
     def alert_ticker_selection(self, ticker: str, score: float, metrics: Dict[str, float], active_tickers: list = None) -> None:
         # Build description with all active tickers
         if active_tickers and len(active_tickers) > 1:
             description = f"**Top {len(active_tickers)} tickers** selected for monitoring:\n\n"
             for t in active_tickers:
-                emoji = "🥇" if t['rank'] == 1 else "🥈" if t['rank'] == 2 else "🥉"
+                emoji = _RANK_EMOJI.get(t['rank'], "🥉")
                 description += f"{emoji} **#{t['rank']}: {t['symbol']}** (Score: {t['score']:.3f})\n"
         else:
             description = f"**{ticker}** has been selected for today's trading"
         
         embed = {
+            **self._SELECTION_SKELETON,
             "title": "🎯 Active Tickers Selected" if active_tickers and len(active_tickers) > 1 else "🎯 Ticker of the Day Selected",
             "description": description,
-            "color": 5763719,  # Green
             "fields": [
                 {"name": "📊 Top Score", "value": f"`{score:.3f}/100`", "inline": True},
                 {"name": "📈 Monitoring", "value": f"`{len(active_tickers) if active_tickers else 1} ticker(s)`", "inline": True},
             ],
-            "thumbnail": {
-                "url": "https://raw.githubusercontent.com/twitter/twemoji/master/assets/72x72/1f4c8.png"
-            },
-            "footer": {
-                "text": "TARA | Pre-Market Scan Complete",
-                "icon_url": "https://raw.githubusercontent.com/twitter/twemoji/master/assets/72x72/1f916.png"
-            },
             "timestamp": self._get_timestamp()
         }
         self.send("", embeds=[embed])
 
     def alert_signal(self, ticker: str, direction: str, reason: str) -> None:
-        color = 5763719 if direction.lower() == 'call' else 15548997  # Green for calls, red for puts
-        emoji = "📈" if direction.lower() == 'call' else "📉"
+        color, emoji = _SIGNAL_STYLE.get(direction.lower(), _SIGNAL_STYLE["put"])
         embed = {
+            **self._SIGNAL_SKELETON,
             "title": f"{emoji} Trading Signal Detected",
             "description": f"**{ticker}** - {direction.upper()}",
             "color": color,
@@ -84,7 +357,6 @@ class DiscordNotifier:
                 {"name": "Direction", "value": f"`{direction.upper()}`", "inline": True},
                 {"name": "Reason", "value": reason, "inline": False},
             ],
-            "footer": {"text": "Scalp Bot | Signal Generator"},
             "timestamp": self._get_timestamp()
         }
         self.send("", embeds=[embed])
@@ -98,9 +370,8 @@ class DiscordNotifier:
         fill_price: float,
     ) -> None:
         embed = {
-            "title": "✅ Order Filled",
+            **self._FILLED_SKELETON,
             "description": f"Successfully entered position in **{ticker}**",
-            "color": 3066993,  # Green
             "fields": [
                 {"name": "📋 Contract", "value": f"`{option_symbol}`", "inline": False},
                 {"name": "📊 Direction", "value": f"`{direction.upper()}`", "inline": True},
@@ -108,7 +379,6 @@ class DiscordNotifier:
                 {"name": "💰 Fill Price", "value": f"`${fill_price:.2f}`", "inline": True},
                 {"name": "💵 Total Cost", "value": f"`${fill_price * contracts * 100:.2f}`", "inline": True},
             ],
-            "footer": {"text": "Scalp Bot | Order Execution"},
             "timestamp": self._get_timestamp()
         }
         self.send("", embeds=[embed])
@@ -121,12 +391,12 @@ class DiscordNotifier:
         exit_price: float,
         pnl_pct: float,
         reason: str,
+        timestamp: Optional[str] = None,
     ) -> None:
-        color = 3066993 if pnl_pct >= 0 else 15158332  # Green for profit, red for loss
-        emoji = "🎉" if pnl_pct >= 0 else "⚠️"
-        status = "PROFIT" if pnl_pct >= 0 else "LOSS"
+        color, emoji, status = _EXIT_STYLE[pnl_pct >= 0]
         
         embed = {
+            **self._EXIT_SKELETON,
             "title": f"{emoji} Position Closed - {status}",
             "description": f"Exited position in **{ticker}**",
             "color": color,
@@ -137,21 +407,18 @@ class DiscordNotifier:
                 {"name": "📊 P/L", "value": f"`{pnl_pct:+.2f}%`", "inline": True},
                 {"name": "📝 Exit Reason", "value": reason, "inline": False},
             ],
-            "footer": {"text": "Scalp Bot | Position Management"},
-            "timestamp": self._get_timestamp()
+            "timestamp": timestamp or self._get_timestamp()
         }
         self.send("", embeds=[embed])
 
     def alert_error(self, context: str, error: Exception) -> None:
         embed = {
-            "title": "🚨 Error Alert",
+            **self._ERROR_SKELETON,
             "description": f"An error occurred in **{context}**",
-            "color": 15158332,  # Red
             "fields": [
                 {"name": "Error Type", "value": f"`{type(error).__name__}`", "inline": True},
                 {"name": "Error Message", "value": f"```{str(error)[:1000]}```", "inline": False},
             ],
-            "footer": {"text": "Scalp Bot | Error Handler"},
             "timestamp": self._get_timestamp()
         }
         self.send("", embeds=[embed])
@@ -179,22 +446,22 @@ class DiscordNotifier:
             })
         
         embed = {
-            "title": "✅ Bot Started Successfully",
+            **self._STARTUP_SKELETON,
             "description": description,
-            "color": 3066993,  # Green
             "fields": fields,
-            "thumbnail": {
-                "url": "https://raw.githubusercontent.com/twitter/twemoji/master/assets/72x72/2705.png"
-            },
-            "footer": {
-                "text": "TARA | Bot Initialized",
-                "icon_url": "https://raw.githubusercontent.com/twitter/twemoji/master/assets/72x72/1f916.png"
-            },
             "timestamp": self._get_timestamp()
         }
         self.send("", embeds=[embed])
     
-    def _get_timestamp(self) -> str:
-        """Get current timestamp in ISO format for Discord embeds."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+    def _get_timestamp(self, ts: Optional[float] = None) -> str:
+        """ISO-8601 UTC timestamp for Discord embeds, from ``ts`` (epoch seconds) or now.
+
+        "Now" is second-resolution (all Discord displays) and rebuilt once per second.
+        """
+        if ts is not None:
+            return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+        second = int(time.time())
+        cached = self._ts_cache
+        if cached[0] != second:
+            cached = self._ts_cache = (second, datetime.fromtimestamp(second, tz=timezone.utc).isoformat())
+        return cached[1]
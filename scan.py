@@ -1,8 +1,11 @@
 import logging
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 import pytz
 
 from broker import BrokerClient
@@ -15,6 +18,23 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Symbols scored side by side; every metric is a broker/OpenAI round-trip, and the
+# broker's connection pool (HTTP_POOL_MAXSIZE) comfortably covers this many
+MAX_SCAN_WORKERS = 8
+# Calendar days of daily bars fetched per symbol: ATR(14) needs period * 3, and the
+# gap reuses the last two bars of the same window
+DAILY_BARS_LOOKBACK_DAYS = 42
+
+# Keyword fallback for news sentiment, matched as whole words ("down" but not "downtown")
+POSITIVE_KEYWORDS = ('beat', 'surge', 'gain', 'up', 'high', 'profit', 'growth', 'strong',
+                     'upgrade', 'buy', 'bullish', 'positive', 'record', 'success', 'win')
+NEGATIVE_KEYWORDS = ('miss', 'drop', 'fall', 'down', 'low', 'loss', 'decline', 'weak',
+                     'downgrade', 'sell', 'bearish', 'negative', 'concern', 'fail', 'lawsuit')
+# Both polarities in one alternation; the named group that matched gives the polarity
+_KEYWORD_RE = re.compile(
+    r"\b(?:(?P<positive>" + "|".join(POSITIVE_KEYWORDS) + r")|(?P<negative>" + "|".join(NEGATIVE_KEYWORDS) + r"))\b"
+)
+
 
 class TickerScanner:
     """Performs the pre-market ticker scan and selects a ticker of the day."""
@@ -29,6 +49,8 @@ class TickerScanner:
         self.notifier = notifier
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # Broker responses memoized for the duration of one run(); None outside a scan
+        self._scan_cache: Optional[Dict[Tuple[Any, ...], Any]] = None
         
         # Initialize OpenAI client if configured
         self.openai_client = None
@@ -58,21 +80,21 @@ class TickerScanner:
         self.logger.info("Starting pre-market scan for symbols: %s", watchlist)
         self.logger.info("Scoring weights: %s (sum=%.2f)", weights, sum(weights.values()))
 
-        scored_tickers: List[Tuple[str, float, Dict[str, float]]] = []
         now_eastern = datetime.now(EASTERN_TZ)
-
-        for symbol in watchlist:
+        self._scan_cache = {}
+
+        # Each symbol's metrics are independent network-bound fetches, so score them
+        # concurrently; map() keeps watchlist order for deterministic tie-breaking
+        max_workers = max(1, min(int(scanning_cfg.get("max_workers", MAX_SCAN_WORKERS)), len(watchlist)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scan") as executor:
+            results = executor.map(
+                lambda symbol: self._safely_compute(symbol, now_eastern, thresholds, weights),
+                watchlist,
+            )
             try:
-                metrics = self._compute_metrics(symbol, now_eastern, thresholds)
-                score = weighted_score(metrics, weights)
-                scored_tickers.append((symbol, score, metrics))
-                
-                # Log at INFO level to help debug scoring
-                self.logger.info("%s - Score: %.2f | Metrics: %s", 
-                               symbol, score, 
-                               {k: f"{v:.2f}" for k, v in metrics.items()})
-            except Exception as exc:  # noqa: BLE001
-                self.logger.exception("Failed to evaluate metrics for %s: %s", symbol, exc)
+                scored_tickers: List[Tuple[str, float, Dict[str, float]]] = [r for r in results if r is not None]
+            finally:
+                self._scan_cache = None
 
         if not scored_tickers:
             self.logger.error("No tickers produced metrics; scan aborted")
@@ -124,6 +146,41 @@ class TickerScanner:
             "active_tickers": active_tickers,
         }
 
+    def _safely_compute(
+        self,
+        symbol: str,
+        reference_time: datetime,
+        thresholds: Dict[str, Any],
+        weights: Dict[str, float],
+    ) -> Optional[Tuple[str, float, Dict[str, float]]]:
+        """Score one symbol, logging (not raising) failures so one bad ticker can't sink the scan."""
+        try:
+            metrics = self._compute_metrics(symbol, reference_time, thresholds)
+            score = weighted_score(metrics, weights)
+        except Exception as exc:  # noqa: BLE001
+            self.logger.exception("Failed to evaluate metrics for %s: %s", symbol, exc)
+            return None
+
+        # Log at INFO level to help debug scoring
+        self.logger.info("%s - Score: %.2f | Metrics: %s",
+                       symbol, score,
+                       {k: f"{v:.2f}" for k, v in metrics.items()})
+        return symbol, score, metrics
+
+    def _cached(self, key: Tuple[Any, ...], fn: Any, *args: Any) -> Any:
+        """Return ``fn(*args)``, fetched at most once per scan for ``key``.
+
+        Each symbol is scored on a single worker thread, so keys never race.
+        """
+        cache = self._scan_cache
+        if cache is None:
+            return fn(*args)
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = fn(*args)
+            return value
+
     # -------------------- Metric Calculations --------------------
     def _compute_metrics(
         self,
@@ -143,10 +200,18 @@ class TickerScanner:
             else 1.0  # Neutral ratio if no historical data
         )
 
-        gap_percent = self._get_gap_percent(symbol)
-        iv_rank = self._get_iv_rank(symbol)
-        option_open_interest = self._get_option_open_interest(symbol)
-        atr = self._get_atr(symbol, period=14)
+        # One daily-bar fetch (the ATR window) serves the gap, the ATR and the IV rank's spot
+        try:
+            daily_bars = self._get_daily_bars(symbol)
+            spot = float(daily_bars[-1]["c"]) if daily_bars else None
+        except Exception as exc:  # noqa: BLE001
+            self.logger.warning("Failed to fetch daily bars for %s: %s", symbol, exc)
+            daily_bars, spot = [], None
+
+        gap_percent = self._get_gap_percent(symbol, daily_bars)
+        iv_rank = self._get_iv_rank(symbol, spot)
+        option_open_interest = self._get_option_open_interest(symbol, reference_time)
+        atr = self._get_atr(symbol, period=14, bars=daily_bars)
         
         # Get news sentiment
         news_sentiment, news_volume = self._get_news_sentiment(symbol)
@@ -186,15 +251,14 @@ class TickerScanner:
                 count += 1
         return total / count if count else 0.0
 
-    def _get_gap_percent(self, symbol: str) -> float:
+    def _get_daily_bars(self, symbol: str, lookback_days: int = DAILY_BARS_LOOKBACK_DAYS) -> List[Dict[str, Any]]:
+        return self._cached(("daily_bars", symbol, lookback_days), self.broker.get_daily_bars, symbol, lookback_days)
+
+    def _get_gap_percent(self, symbol: str, bars: Optional[List[Dict[str, Any]]] = None) -> float:
         """Calculate gap % from previous close to today's open."""
         try:
-            bars = self.broker.get_historical_bars(
-                symbol,
-                "1Day",
-                start=datetime.now(pytz.UTC) - timedelta(days=10),
-                limit=5,
-            )
+            if bars is None:
+                bars = self._get_daily_bars(symbol)
             if len(bars) < 2:
                 return 0.0
             today_bar = bars[-1]
@@ -208,38 +272,53 @@ class TickerScanner:
             self.logger.warning("Failed to calculate gap for %s: %s", symbol, exc)
             return 0.0
 
-    def _get_iv_rank(self, symbol: str) -> float:
-        """Calculate IV rank (0-100) for the symbol."""
+    def _get_iv_rank(self, symbol: str, spot: Optional[float] = None) -> float:
+        """Calculate IV rank (0-100) for the symbol.
+
+        Ranks the at-the-money contract's IV (strike nearest ``spot``) within the
+        chain's IV range, in one pass over the chain. Without a spot price the
+        chain's mean IV stands in for the current level.
+        """
         try:
-            chain = self.broker.get_option_chain(symbol)
+            chain = self._cached(("chain", symbol), self.broker.get_option_chain, symbol)
             if not chain:
                 return 50.0  # Neutral if no data
             
-            iv_values = []
+            iv_min, iv_max, iv_sum, iv_count = math.inf, -math.inf, 0.0, 0
+            atm_iv, atm_distance = None, math.inf
             for opt in chain:
                 iv = opt.get("implied_volatility") or opt.get("iv")
-                if iv is not None and float(iv) > 0:
-                    iv_values.append(float(iv))
-            
-            if not iv_values:
-                return 50.0
-            
-            current_iv = float(max(iv_values))
-            iv_min = min(iv_values)
-            iv_max = max(iv_values)
+                if not iv:
+                    continue
+                iv = float(iv)
+                if iv <= 0:
+                    continue
+                if iv < iv_min:
+                    iv_min = iv
+                if iv > iv_max:
+                    iv_max = iv
+                iv_sum += iv
+                iv_count += 1
+                strike = opt.get("strike_price")
+                if spot is not None and strike is not None:
+                    distance = abs(float(strike) - spot)
+                    if distance < atm_distance:
+                        atm_iv, atm_distance = iv, distance
             
-            if iv_max == iv_min:
+            if not iv_count or iv_max == iv_min:
                 return 50.0
             
+            current_iv = atm_iv if atm_iv is not None else iv_sum / iv_count
             return (current_iv - iv_min) / (iv_max - iv_min) * 100.0
         except Exception as exc:
             self.logger.warning("Failed to calculate IV rank for %s: %s", symbol, exc)
             return 50.0
 
-    def _get_option_open_interest(self, symbol: str) -> float:
-        chain = self.broker.get_option_chain(symbol)
+    def _get_option_open_interest(self, symbol: str, as_of: Optional[datetime] = None) -> float:
+        chain = self._cached(("chain", symbol), self.broker.get_option_chain, symbol)
         total_interest = 0.0
-        now = datetime.now(pytz.UTC).date()  # Use date only for comparison
+        # Use date only for comparison; a scan passes its own clock sample
+        now = (as_of.astimezone(pytz.UTC) if as_of is not None else datetime.now(pytz.UTC)).date()
         for option in chain:
             expiration = option.get("expiration_date")
             if not expiration:
@@ -263,34 +342,28 @@ class TickerScanner:
                     pass  # Skip invalid OI values
         return total_interest
 
-    def _get_atr(self, symbol: str, period: int = 14) -> float:
+    def _get_atr(self, symbol: str, period: int = 14, bars: Optional[List[Dict[str, Any]]] = None) -> float:
         """Calculate Average True Range for volatility measure."""
         try:
-            bars = self.broker.get_historical_bars(
-                symbol,
-                "1Day",
-                start=datetime.now(pytz.UTC) - timedelta(days=period * 3),
-            )
+            if bars is None:
+                bars = self._get_daily_bars(symbol, max(DAILY_BARS_LOOKBACK_DAYS, period * 3))
             if len(bars) < period:
                 return 0.0
 
-            df = pd.DataFrame(bars)
-            df["high"] = df["h"].astype(float)
-            df["low"] = df["l"].astype(float)
-            df["close"] = df["c"].astype(float)
-            df["prev_close"] = df["close"].shift(1)
-
-            tr_components = pd.DataFrame(
-                {
-                    "hl": df["high"] - df["low"],
-                    "hc": (df["high"] - df["prev_close"]).abs(),
-                    "lc": (df["low"] - df["prev_close"]).abs(),
-                }
+            count = len(bars)
+            high = np.fromiter((float(bar["h"]) for bar in bars), dtype=np.float64, count=count)
+            low = np.fromiter((float(bar["l"]) for bar in bars), dtype=np.float64, count=count)
+            close = np.fromiter((float(bar["c"]) for bar in bars), dtype=np.float64, count=count)
+
+            # True range; the first bar has no previous close, so it is just high - low
+            true_range = high - low
+            prev_close = close[:-1]
+            true_range[1:] = np.maximum.reduce(
+                [true_range[1:], np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)]
             )
-            df["tr"] = tr_components.max(axis=1)
 
-            atr = df["tr"].rolling(window=period).mean().iloc[-1]
-            return float(atr) if pd.notna(atr) else 0.0
+            atr = true_range[-period:].mean()
+            return float(atr) if np.isfinite(atr) else 0.0
         except Exception as exc:
             self.logger.warning("Failed to calculate ATR for %s: %s", symbol, exc)
             return 0.0
@@ -305,7 +378,7 @@ class TickerScanner:
         """
         try:
             # Get news from last 24 hours
-            articles = self.broker.get_news(symbol, limit=50)
+            articles = self.broker.get_news(symbol, limit=50, fields=("headline", "summary"))
             
             if not articles:
                 return 0.0, 0  # Neutral sentiment, no news
@@ -401,17 +474,14 @@ Respond with ONLY a number between -1.0 and +1.0, nothing else."""
         Returns:
             Average sentiment score from -1.0 to +1.0
         """
-        positive_keywords = ['beat', 'surge', 'gain', 'up', 'high', 'profit', 'growth', 'strong', 
-                           'upgrade', 'buy', 'bullish', 'positive', 'record', 'success', 'win']
-        negative_keywords = ['miss', 'drop', 'fall', 'down', 'low', 'loss', 'decline', 'weak',
-                           'downgrade', 'sell', 'bearish', 'negative', 'concern', 'fail', 'lawsuit']
-        
         sentiment_scores = []
         for article in articles:
-            headline = (article.get('headline', '') + ' ' + article.get('summary', '')).lower()
+            text = f"{article.get('headline', '')} {article.get('summary', '')}".casefold()
             
-            positive_count = sum(1 for word in positive_keywords if word in headline)
-            negative_count = sum(1 for word in negative_keywords if word in headline)
+            # One scan per article; each keyword still counts once per article
+            matched = {(match.lastgroup, match.group()) for match in _KEYWORD_RE.finditer(text)}
+            positive_count = sum(1 for polarity, _ in matched if polarity == "positive")
+            negative_count = len(matched) - positive_count
             
             # Calculate article sentiment (-1 to +1)
             if positive_count + negative_count > 0:
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -10,6 +10,61 @@ from broker import BrokerClient
 from notifications import DiscordNotifier
 from utils import EASTERN_TZ, within_trading_windows, eastern_now
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels run as plain NumPy without numba."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def ema_rsi(close: np.ndarray, short_period: int, long_period: int, rsi_period: int):
+    """Return (ema_short, ema_long, rsi) arrays for a close series.
+
+    Matches the pandas ``ewm(adjust=False)`` definitions used by
+    ``SignalDetector._compute_indicators``; rsi[0] is NaN.
+    """
+    n = close.shape[0]
+    ema_short = np.empty(n)
+    ema_long = np.empty(n)
+    rsi = np.full(n, np.nan)
+    if n == 0:
+        return ema_short, ema_long, rsi
+
+    a_short = 2.0 / (short_period + 1)
+    a_long = 2.0 / (long_period + 1)
+    a_rsi = 1.0 / rsi_period
+    ema_short[0] = close[0]
+    ema_long[0] = close[0]
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        price = close[i]
+        ema_short[i] = a_short * price + (1.0 - a_short) * ema_short[i - 1]
+        ema_long[i] = a_long * price + (1.0 - a_long) * ema_long[i - 1]
+
+        delta = price - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i == 1:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain = a_rsi * gain + (1.0 - a_rsi) * avg_gain
+            avg_loss = a_rsi * loss + (1.0 - a_rsi) * avg_loss
+
+        if avg_loss > 0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            rsi[i] = 100.0
+    return ema_short, ema_long, rsi
+
 
 class SignalDetector:
     """Evaluates EMA/RSi/volume-based entry signals for a single ticker."""
@@ -27,6 +82,9 @@ class SignalDetector:
         self.signals_cfg = config.get("signals", {})
         self.trading_cfg = config.get("trading", {})
         self.poll_interval = self.signals_cfg.get("poll_interval_seconds", 15)
+        if NUMBA_AVAILABLE:
+            # Compile (or load the cached) kernel now rather than on the first signal poll
+            ema_rsi(np.zeros(2), 2, 3, 2)
 
     def evaluate(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Evaluate the latest market data and emit a trade signal if criteria met."""
@@ -125,6 +183,23 @@ class SignalDetector:
             return None
         return bars
 
+    def _get_recent_bars_multi(self, symbols: List[str]) -> Optional[Dict[str, list]]:
+        """Fetch the lookback window for several symbols in a single request."""
+        lookback_minutes = self.signals_cfg.get("lookback_minutes", 120)
+        end = datetime.now(pytz.UTC)
+        start = end - timedelta(minutes=lookback_minutes)
+        try:
+            return self.broker.get_historical_bars_multi(
+                symbols,
+                "1Min",
+                start=start,
+                end=end,
+                limit=lookback_minutes,
+            )
+        except Exception as exc:  # noqa: BLE001
+            self.logger.error("Failed to fetch bars for %s: %s", symbols, exc)
+            return None
+
     def _prepare_dataframe(self, bars: list) -> pd.DataFrame:
         df = pd.DataFrame(bars)
         df["timestamp"] = pd.to_datetime(df["t"], utc=True).dt.tz_convert(EASTERN_TZ)
@@ -142,19 +217,14 @@ class SignalDetector:
         long_period = self.signals_cfg.get("ema_long_period", 21)
         rsi_period = self.signals_cfg.get("rsi_period", 14)
 
-        df["ema_short"] = df["close"].ewm(span=short_period, adjust=False).mean()
-        df["ema_long"] = df["close"].ewm(span=long_period, adjust=False).mean()
-        df["diff"] = df["ema_short"] - df["ema_long"]
-
-        delta = df["close"].diff()
-        gain = delta.clip(lower=0)
-        loss = -delta.clip(upper=0)
-
-        avg_gain = gain.ewm(alpha=1 / rsi_period, adjust=False).mean()
-        avg_loss = loss.ewm(alpha=1 / rsi_period, adjust=False).mean()
-
-        rs = avg_gain / avg_loss
-        df["rsi"] = 100 - (100 / (1 + rs))
+        # One pass over the close column instead of six pandas passes
+        ema_short, ema_long, rsi = ema_rsi(
+            df["close"].to_numpy(dtype=np.float64), short_period, long_period, rsi_period
+        )
+        df["ema_short"] = ema_short
+        df["ema_long"] = ema_long
+        df["diff"] = ema_short - ema_long
+        df["rsi"] = rsi
 
     def _detect_crossover(self, previous: pd.Series, latest: pd.Series) -> Optional[str]:
         prev_diff = previous["diff"]
@@ -31,7 +31,7 @@ def test_individual_metrics():
     
     config = load_config()
     broker = BrokerClient(config)
-    notifier = DiscordNotifier(config)
+    notifier = DiscordNotifier.from_config(config)
     scanner = TickerScanner(broker, notifier, config)
     
     symbol = 'SPY'
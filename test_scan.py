@@ -34,7 +34,7 @@ def test_news_sentiment():
     try:
         config = load_config()
         broker = BrokerClient(config)
-        notifier = DiscordNotifier(config)
+        notifier = DiscordNotifier.from_config(config)
         scanner = TickerScanner(broker, notifier, config)
         
         # Test with a popular stock
@@ -76,7 +76,7 @@ def test_metric_calculation():
     try:
         config = load_config()
         broker = BrokerClient(config)
-        notifier = DiscordNotifier(config)
+        notifier = DiscordNotifier.from_config(config)
         scanner = TickerScanner(broker, notifier, config)
         
         symbol = 'SPY'
@@ -126,7 +126,7 @@ def test_full_scan():
         print(f"\nTesting with symbols: {test_watchlist}")
         
         broker = BrokerClient(config)
-        notifier = DiscordNotifier(config)
+        notifier = DiscordNotifier.from_config(config)
         scanner = TickerScanner(broker, notifier, config)
         
         print(f"\nRunning pre-market scan...")
@@ -1,5 +1,7 @@
+import tempfile
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytz
@@ -55,6 +57,17 @@ class TestBrokerClient(unittest.TestCase):
         with self.assertRaises(ValueError):
             BrokerClient(config)
 
+    @patch("broker.REST")
+    def test_init_retry_config(self, mock_rest):
+        """Test retry settings are mounted on the session and SDK retries disabled."""
+        config = dict(self.config, alpaca=dict(self.config["alpaca"], retry={"max_attempts": 5}))
+        broker = BrokerClient(config)
+
+        adapter = broker.client._session.mount.call_args[0][1]
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertEqual(broker.client._retry, 0)
+
     @patch("broker.REST")
     def test_get_current_price_bid_ask(self, mock_rest):
         """Test current price calculation with bid/ask."""
@@ -111,6 +124,147 @@ class TestBrokerClient(unittest.TestCase):
         expected = 1000 + 2000
         self.assertEqual(volume, expected)
 
+    @patch("broker.REST")
+    def test_get_historical_bars_multi(self, mock_rest):
+        """Test multi-symbol bars are fanned out per symbol and limited per symbol."""
+        mock_client = MagicMock()
+        raw_bars = [
+            {"S": "AAPL", "t": "2024-01-15T14:30:00Z", "c": 1.0},
+            {"S": "AAPL", "t": "2024-01-15T14:31:00Z", "c": 2.0},
+            {"S": "AAPL", "t": "2024-01-15T14:32:00Z", "c": 3.0},
+            {"S": "MSFT", "t": "2024-01-15T14:30:00Z", "c": 4.0},
+        ]
+        mock_client.get_bars_iter.return_value = iter(raw_bars)
+
+        broker = BrokerClient(self.config)
+        broker.client = mock_client
+
+        result = broker.get_historical_bars_multi(
+            ["AAPL", "MSFT", "TSLA"], "1Min", start=datetime(2024, 1, 15, 14, 0), limit=2
+        )
+
+        mock_client.get_bars_iter.assert_called_once()
+        self.assertEqual(mock_client.get_bars_iter.call_args[0][0], ["AAPL", "MSFT", "TSLA"])
+        self.assertTrue(mock_client.get_bars_iter.call_args[1]["raw"])
+        self.assertEqual([bar["c"] for bar in result["AAPL"]], [2.0, 3.0])
+        self.assertEqual(len(result["MSFT"]), 1)
+        self.assertEqual(result["TSLA"], [])
+
+    @patch("broker.REST")
+    def test_get_option_chain_cached(self, mock_rest):
+        """Test repeated chain lookups hit the API once, including empty chains."""
+        broker = BrokerClient(self.config)
+        broker.trading_client = MagicMock()
+        contract = Mock(symbol="AAPL240115C00150000", strike_price=150.0, type="call",
+                        expiration_date="2024-01-15", open_interest=10, size=100)
+        broker.trading_client.get_option_contracts.return_value = Mock(option_contracts=[contract], next_page_token=None)
+
+        first = broker.get_option_chain("AAPL", "2024-01-15")
+        second = broker.get_option_chain("AAPL", "2024-01-15")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[0].strike_price, 150.0)
+        self.assertEqual(first[0].get("option_type"), "call")
+        self.assertIsNone(first[0].get("ask_price"))
+        broker.trading_client.get_option_contracts.assert_called_once()
+
+        broker.trading_client.get_option_contracts.return_value = Mock(option_contracts=[], next_page_token=None)
+        broker.get_option_chain("XYZ", "2024-01-15")
+        broker.get_option_chain("XYZ", "2024-01-15")
+        self.assertEqual(broker.trading_client.get_option_contracts.call_count, 2)
+
+    @patch("broker.REST")
+    def test_get_option_chain_fans_out_per_expiration(self, mock_rest):
+        """Test an open-ended chain is fetched per weekday expiration and paged."""
+        broker = BrokerClient(self.config)
+        broker.trading_client = MagicMock()
+        contract = Mock(symbol="SPY", strike_price=500.0, type="put",
+                        expiration_date="2024-01-15", open_interest=None, size=100)
+        pages = {}
+
+        def get_contracts(request):
+            # Two pages per expiration date
+            page = pages.setdefault(request.expiration_date, 0)
+            pages[request.expiration_date] += 1
+            return Mock(option_contracts=[contract], next_page_token=None if page else "next")
+
+        broker.trading_client.get_option_contracts.side_effect = get_contracts
+
+        chain = broker.get_option_chain("SPY")
+
+        today = datetime.now(pytz.timezone("US/Eastern")).date()
+        weekdays = [today + timedelta(days=i) for i in range(6) if (today + timedelta(days=i)).weekday() < 5]
+        self.assertEqual(sorted(pages), [day.isoformat() for day in weekdays])
+        self.assertTrue(all(count == 2 for count in pages.values()))
+        self.assertEqual(len(chain), 2 * len(weekdays))
+        self.assertEqual(chain[0].open_interest, 0)
+
+    @patch("broker.REST")
+    def test_get_option_chain_errors_not_cached(self, mock_rest):
+        """Test failed chain lookups return [] without being cached."""
+        broker = BrokerClient(self.config)
+        broker.trading_client = MagicMock()
+        broker.trading_client.get_option_contracts.side_effect = RuntimeError("boom")
+
+        self.assertEqual(broker.get_option_chain("AAPL", "2024-01-15"), [])
+        self.assertEqual(broker.get_option_chain("AAPL", "2024-01-15"), [])
+        self.assertEqual(broker.trading_client.get_option_contracts.call_count, 2)
+
+    @patch("broker.REST")
+    def test_get_previous_close_persisted_for_the_day(self, mock_rest):
+        """Test the previous close is fetched once and reused across clients."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch("broker.PREV_CLOSE_CACHE_FILE", Path(tmp_dir) / "prev_close_cache.json"):
+                broker = BrokerClient(self.config)
+                broker.get_historical_bars = Mock(return_value=[{"c": 150.0}, {"c": 151.0}])
+                self.assertEqual(broker.get_previous_close("AAPL"), 150.0)
+                self.assertEqual(broker.get_previous_close("AAPL"), 150.0)
+                broker.get_historical_bars.assert_called_once()
+
+                restarted = BrokerClient(self.config)
+                restarted.get_historical_bars = Mock()
+                self.assertEqual(restarted.get_previous_close("AAPL"), 150.0)
+                restarted.get_historical_bars.assert_not_called()
+
+    @patch("broker.REST")
+    def test_get_news_fields(self, mock_rest):
+        """Test news articles keep only the requested fields."""
+        mock_client = MagicMock()
+        mock_client.get_news_iter.return_value = iter([
+            {"headline": "AAPL beats", "summary": "Strong quarter", "author": "x", "url": "u"},
+            {"headline": "AAPL guidance"},
+        ])
+
+        broker = BrokerClient(self.config)
+        broker.client = mock_client
+
+        articles = broker.get_news("AAPL", fields=("headline", "summary"))
+
+        self.assertEqual(articles, [
+            {"headline": "AAPL beats", "summary": "Strong quarter"},
+            {"headline": "AAPL guidance", "summary": ""},
+        ])
+        self.assertTrue(mock_client.get_news_iter.call_args[1]["raw"])
+
+    @patch("broker.REST")
+    def test_get_daily_bars_caches_completed_sessions(self, mock_rest):
+        """Test completed daily bars are reused and only newer days are refetched."""
+        today = datetime.now(pytz.timezone("US/Eastern")).date()
+        day = lambda offset: f"{(today - timedelta(days=offset)).isoformat()}T05:00:00Z"
+        completed = [{"t": day(3), "c": 1.0}, {"t": day(2), "c": 2.0}]
+        forming = {"t": day(0), "c": 3.0}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch("broker.DAILY_BARS_CACHE_DIR", Path(tmp_dir)):
+                broker = BrokerClient(self.config)
+                broker.get_historical_bars = Mock(return_value=completed + [forming])
+                self.assertEqual(broker.get_daily_bars("AAPL", 10), completed + [forming])
+
+                broker.get_historical_bars = Mock(return_value=[forming])
+                self.assertEqual(broker.get_daily_bars("AAPL", 10), completed + [forming])
+                start = broker.get_historical_bars.call_args[1]["start"]
+                self.assertEqual(start.date(), today - timedelta(days=1))
+
     @patch("broker.REST")
     def test_get_cash_balance(self, mock_rest):
         """Test cash balance retrieval."""
@@ -155,17 +309,32 @@ class TestBrokerClient(unittest.TestCase):
     def test_submit_order(self, mock_rest):
         """Test order submission."""
         mock_client = MagicMock()
-        mock_order = Mock()
-        mock_order.id = "order_123"
-        mock_order._raw = {"id": "order_123", "symbol": "AAPL"}
-        mock_client.submit_order.return_value = mock_order
+        mock_client.post.return_value = {"id": "order_123", "symbol": "AAPL"}
 
         broker = BrokerClient(self.config)
         broker.client = mock_client
 
         result = broker.submit_order(symbol="AAPL", qty=10, side="buy")
         self.assertEqual(result["id"], "order_123")
-        mock_client.submit_order.assert_called_once()
+        mock_client.post.assert_called_once_with(
+            "/orders",
+            {"symbol": "AAPL", "side": "buy", "type": "market", "time_in_force": "day", "qty": 10},
+        )
+
+    @patch("broker.REST")
+    def test_submit_order_limit_price(self, mock_rest):
+        """Test a limit order carries its limit price as a float."""
+        mock_client = MagicMock()
+        mock_client.post.return_value = {"id": "order_456"}
+
+        broker = BrokerClient(self.config)
+        broker.client = mock_client
+
+        broker.submit_order("AAPL240115C00150000", 2, "sell", type_="limit", limit_price=1.25)
+
+        params = mock_client.post.call_args[0][1]
+        self.assertEqual(params["qty"], 2)
+        self.assertEqual(params["limit_price"], 1.25)
 
     @patch("broker.REST")
     def test_get_option_market_price(self, mock_rest):
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from datetime import datetime
 from unittest.mock import Mock, patch
@@ -146,6 +147,8 @@ class TestPositionMonitor(unittest.TestCase):
 
         # Should close on timeout (5 minutes = 300 seconds)
         self.mock_broker.submit_order.assert_called_once()
+        # A cheap exit rule fired, so the bar-fetching reversal check never ran
+        self.mock_signal_detector.has_reversal.assert_not_called()
 
         call_args = self.mock_notifier.alert_exit.call_args
         self.assertEqual(call_args[1]["reason"], "timeout")
@@ -187,13 +190,17 @@ class TestPositionMonitor(unittest.TestCase):
         call_args = self.mock_notifier.alert_exit.call_args
         self.assertEqual(call_args[1]["reason"], "end of day")
 
+    @patch("monitor.datetime")
     @patch("monitor.append_trade_log")
     @patch("monitor.update_state")
     @patch("monitor.read_state")
-    def test_evaluate_ema_reversal(self, mock_read_state, mock_update_state, mock_log):
+    def test_evaluate_ema_reversal(self, mock_read_state, mock_update_state, mock_log, mock_datetime):
         """Test exit on EMA reversal."""
         eastern = pytz.timezone("US/Eastern")
         entry_time = eastern.localize(datetime(2024, 1, 15, 9, 35))
+        current_time = eastern.localize(datetime(2024, 1, 15, 9, 37))  # before timeout and EOD
+
+        mock_datetime.now.return_value = current_time
 
         mock_read_state.return_value = {
             "open_position": {
@@ -211,7 +218,8 @@ class TestPositionMonitor(unittest.TestCase):
         self.mock_broker.get_option_market_price = Mock(return_value=5.20)
         self.mock_signal_detector.has_reversal = Mock(return_value=True)
 
-        self.monitor.evaluate()
+        with patch("monitor.minutes_between", return_value=2.0):
+            self.monitor.evaluate()
 
         # Should close on reversal
         self.mock_broker.submit_order.assert_called_once()
@@ -244,6 +252,15 @@ class TestPositionMonitor(unittest.TestCase):
 
         # Should not close when price unavailable
         self.mock_broker.submit_order.assert_not_called()
+        self.mock_signal_detector.has_reversal.assert_not_called()
+
+    def test_on_quote_ignores_zero_bid(self):
+        """Test a streamed quote with no bid is priced at the ask, not ask / 2."""
+        quote = Mock(symbol="AAPL_240115C00150000", ask_price=0.40, bid_price=0.0)
+
+        asyncio.run(self.monitor._on_quote(quote))
+
+        self.assertEqual(self.monitor._last_price["AAPL_240115C00150000"][1], 0.40)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+import json
+import time
 import unittest
 from unittest.mock import Mock, patch
 
@@ -21,7 +23,7 @@ class TestDiscordNotifier(unittest.TestCase):
         notifier = DiscordNotifier(None)
         self.assertFalse(notifier.is_configured())
 
-    @patch("notifications.requests.post")
+    @patch("notifications.requests.Session.post")
     def test_send_success(self, mock_post):
         """Test successful message send."""
         mock_response = Mock()
@@ -29,13 +31,14 @@ class TestDiscordNotifier(unittest.TestCase):
         mock_post.return_value = mock_response
 
         self.notifier.send("Test message")
+        self.notifier.flush(timeout=5)
 
         mock_post.assert_called_once()
         call_args = mock_post.call_args
         self.assertEqual(call_args[0][0], self.webhook_url)
-        self.assertEqual(call_args[1]["json"]["content"], "Test message")
+        self.assertEqual(json.loads(call_args[1]["data"])["content"], "Test message")
 
-    @patch("notifications.requests.post")
+    @patch("notifications.requests.Session.post")
     def test_send_with_embeds(self, mock_post):
         """Test sending with Discord embeds."""
         mock_response = Mock()
@@ -44,13 +47,14 @@ class TestDiscordNotifier(unittest.TestCase):
 
         embeds = [{"title": "Test", "description": "Embed content"}]
         self.notifier.send("Test message", embeds=embeds)
+        self.notifier.flush(timeout=5)
 
         call_args = mock_post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         self.assertEqual(payload["content"], "Test message")
         self.assertEqual(payload["embeds"], embeds)
 
-    @patch("notifications.requests.post")
+    @patch("notifications.requests.Session.post")
     def test_send_error_handling(self, mock_post):
         """Test error handling on failed send."""
         mock_response = Mock()
@@ -60,17 +64,85 @@ class TestDiscordNotifier(unittest.TestCase):
 
         # Should not raise exception
         self.notifier.send("Test message")
+        self.notifier.flush(timeout=5)
 
-    @patch("notifications.requests.post")
+    @patch("notifications.time.sleep")
+    @patch("notifications.requests.Session.post")
+    def test_send_retries_rate_limited(self, mock_post, mock_sleep):
+        """Test a 429 response is retried after its Retry-After delay."""
+        limited = Mock(status_code=429, headers={"Retry-After": "2.5"})
+        mock_post.side_effect = [limited, Mock(status_code=204)]
+
+        self.notifier.send("Test message")
+        self.notifier.flush(timeout=5)
+
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once_with(2.5)
+
+    @patch("notifications.time.monotonic")
+    @patch("notifications.requests.Session.post")
+    def test_send_suppresses_duplicates(self, mock_post, mock_monotonic):
+        """Test repeats within the window are dropped and reported once on flush."""
+        mock_post.return_value = Mock(status_code=204)
+        mock_monotonic.return_value = 1000.0
+
+        for _ in range(3):
+            self.notifier.send("Same alert")
+        self.notifier.flush(timeout=5)
+
+        mock_monotonic.return_value = 1061.0
+        self.notifier.send("Same alert")
+        self.notifier.flush(timeout=5)
+
+        contents = [json.loads(c[1]["data"])["content"] for c in mock_post.call_args_list]
+        self.assertEqual(contents, [
+            "Same alert",
+            "🔁 Suppressed 2 duplicate(s) of: Same alert",
+            "Same alert",
+        ])
+
+    @patch("notifications.DUPLICATE_SWEEP_SECONDS", 0.01)
+    @patch("notifications.time.monotonic")
+    @patch("notifications.requests.Session.post")
+    def test_suppressed_duplicates_reported_when_alerts_stop(self, mock_post, mock_monotonic):
+        """Test the idle worker reports an expired storm with no later send to trigger it."""
+        mock_post.return_value = Mock(status_code=204)
+        mock_monotonic.return_value = 1000.0
+
+        for _ in range(3):
+            self.notifier.send("Same alert")
+        mock_monotonic.return_value = 1061.0
+
+        deadline = time.time() + 5
+        while mock_post.call_count < 2 and time.time() < deadline:
+            time.sleep(0.01)
+
+        contents = [json.loads(c[1]["data"])["content"] for c in mock_post.call_args_list]
+        self.assertEqual(contents, ["Same alert", "🔁 Suppressed 2 duplicate(s) of: Same alert"])
+
+    @patch("notifications.MAX_QUEUED_ALERTS", 2)
+    def test_send_drops_oldest_when_queue_full(self):
+        """Test a full queue sheds its oldest alert instead of blocking the caller."""
+        notifier = DiscordNotifier(self.webhook_url)
+        notifier._worker = Mock(is_alive=Mock(return_value=True))  # keep the worker from draining
+
+        for message in ("first", "second", "third"):
+            notifier.send(message)
+
+        queued = [notifier._queue.get_nowait()["content"] for _ in range(notifier._queue.qsize())]
+        self.assertEqual(queued, ["second", "third"])
+
+    @patch("notifications.requests.Session.post")
     def test_send_not_configured(self, mock_post):
         """Test send when not configured."""
         notifier = DiscordNotifier(None)
         notifier.send("Test message")
+        notifier.flush(timeout=5)
 
         # Should not call post
         mock_post.assert_not_called()
 
-    @patch("notifications.requests.post")
+    @patch("notifications.requests.Session.post")
     def test_alert_ticker_selection(self, mock_post):
         """Test ticker selection alert."""
         mock_response = Mock()
@@ -84,16 +156,17 @@ class TestDiscordNotifier(unittest.TestCase):
         }
 
         self.notifier.alert_ticker_selection("AAPL", 85.5, metrics)
+        self.notifier.flush(timeout=5)
 
         mock_post.assert_called_once()
         call_args = mock_post.call_args
-        content = call_args[1]["json"]["content"]
+        content = call_args[1]["data"].decode("utf-8")
 
         self.assertIn("AAPL", content)
         self.assertIn("85.5", content)
         self.assertIn("premarket_volume", content)
 
-    @patch("notifications.requests.post")
+    @patch("notifications.requests.Session.post")
     def test_alert_signal(self, mock_post):
         """Test signal alert."""
         mock_response = Mock()
@@ -101,15 +174,16 @@ class TestDiscordNotifier(unittest.TestCase):
         mock_post.return_value = mock_response
 
         self.notifier.alert_signal("AAPL", "call", "EMA crossover with RSI confirmation")
+        self.notifier.flush(timeout=5)
 
         call_args = mock_post.call_args
-        content = call_args[1]["json"]["content"]
+        content = call_args[1]["data"].decode("utf-8")
 
         self.assertIn("AAPL", content)
         self.assertIn("CALL", content)
         self.assertIn("EMA crossover", content)
 
-    @patch("notifications.requests.post")
+    @patch("notifications.requests.Session.post")
     def test_alert_order_filled(self, mock_post):
         """Test order filled alert."""
         mock_response = Mock()
@@ -123,16 +197,17 @@ class TestDiscordNotifier(unittest.TestCase):
             contracts=10,
             fill_price=5.25,
         )
+        self.notifier.flush(timeout=5)
 
         call_args = mock_post.call_args
-        content = call_args[1]["json"]["content"]
+        content = call_args[1]["data"].decode("utf-8")
 
         self.assertIn("AAPL", content)
         self.assertIn("CALL", content)
         self.assertIn("10", content)
         self.assertIn("5.25", content)
 
-    @patch("notifications.requests.post")
+    @patch("notifications.requests.Session.post")
     def test_alert_exit(self, mock_post):
         """Test exit alert."""
         mock_response = Mock()
@@ -147,16 +222,17 @@ class TestDiscordNotifier(unittest.TestCase):
             pnl_pct=14.3,
             reason="profit target",
         )
+        self.notifier.flush(timeout=5)
 
         call_args = mock_post.call_args
-        content = call_args[1]["json"]["content"]
+        content = call_args[1]["data"].decode("utf-8")
 
         self.assertIn("AAPL", content)
         self.assertIn("6.00", content)
         self.assertIn("14.3", content)
         self.assertIn("profit target", content)
 
-    @patch("notifications.requests.post")
+    @patch("notifications.requests.Session.post")
     def test_alert_error(self, mock_post):
         """Test error alert."""
         mock_response = Mock()
@@ -165,9 +241,10 @@ class TestDiscordNotifier(unittest.TestCase):
 
         test_error = ValueError("Test error message")
         self.notifier.alert_error("trade execution", test_error)
+        self.notifier.flush(timeout=5)
 
         call_args = mock_post.call_args
-        content = call_args[1]["json"]["content"]
+        content = call_args[1]["data"].decode("utf-8")
 
         self.assertIn("trade execution", content)
         self.assertIn("Test error message", content)
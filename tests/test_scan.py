@@ -51,11 +51,13 @@ class TestTickerScanner(unittest.TestCase):
         mock_read_state.return_value = {}
 
         # Mock metrics for each symbol
-        self.scanner._compute_metrics = Mock(side_effect=[
-            {"premarket_volume": 50, "gap_percent": 40, "iv_rank": 60, "option_open_interest": 30, "atr": 20},
-            {"premarket_volume": 70, "gap_percent": 60, "iv_rank": 80, "option_open_interest": 50, "atr": 40},
-            {"premarket_volume": 40, "gap_percent": 30, "iv_rank": 50, "option_open_interest": 20, "atr": 10},
-        ])
+        # Symbols are scored concurrently, so key the metrics by symbol rather than call order
+        metrics_by_symbol = {
+            "AAPL": {"premarket_volume": 50, "gap_percent": 40, "iv_rank": 60, "option_open_interest": 30, "atr": 20},
+            "MSFT": {"premarket_volume": 70, "gap_percent": 60, "iv_rank": 80, "option_open_interest": 50, "atr": 40},
+            "TSLA": {"premarket_volume": 40, "gap_percent": 30, "iv_rank": 50, "option_open_interest": 20, "atr": 10},
+        }
+        self.scanner._compute_metrics = Mock(side_effect=lambda symbol, *_: metrics_by_symbol[symbol])
 
         result = self.scanner.run()
 
@@ -112,7 +114,7 @@ class TestTickerScanner(unittest.TestCase):
             {"o": 100.0, "h": 102.0, "l": 99.0, "c": 101.0},
             {"o": 103.0, "h": 105.0, "l": 102.0, "c": 104.0},
         ]
-        self.mock_broker.get_historical_bars = Mock(return_value=bars)
+        self.mock_broker.get_daily_bars = Mock(return_value=bars)
 
         gap_pct = self.scanner._get_gap_percent("AAPL")
         expected = (103.0 - 101.0) / 101.0 * 100
@@ -120,7 +122,7 @@ class TestTickerScanner(unittest.TestCase):
 
     def test_get_gap_percent_insufficient_bars(self):
         """Test gap calculation with insufficient data."""
-        self.mock_broker.get_historical_bars = Mock(return_value=[])
+        self.mock_broker.get_daily_bars = Mock(return_value=[])
 
         gap_pct = self.scanner._get_gap_percent("AAPL")
         self.assertEqual(gap_pct, 0.0)
@@ -128,17 +130,17 @@ class TestTickerScanner(unittest.TestCase):
     def test_get_iv_rank(self):
         """Test IV rank calculation."""
         chain = [
-            {"implied_volatility": 0.25},
-            {"implied_volatility": 0.35},
-            {"implied_volatility": 0.45},
-            {"implied_volatility": 0.55},
+            {"strike_price": 95.0, "implied_volatility": 0.25},
+            {"strike_price": 100.0, "implied_volatility": 0.35},
+            {"strike_price": 105.0, "implied_volatility": 0.45},
+            {"strike_price": 110.0, "implied_volatility": 0.55},
         ]
         self.mock_broker.get_option_chain = Mock(return_value=chain)
 
-        iv_rank = self.scanner._get_iv_rank("AAPL")
-
-        # Current IV is max (0.55), so rank should be 100
-        self.assertEqual(iv_rank, 100.0)
+        # Strike 105 is at the money, so its IV (0.45) is ranked within 0.25-0.55
+        self.assertAlmostEqual(self.scanner._get_iv_rank("AAPL", spot=104.0), 200.0 / 3)
+        # Without a spot price the mean IV (0.40) is ranked instead
+        self.assertAlmostEqual(self.scanner._get_iv_rank("AAPL"), 50.0)
 
     def test_get_iv_rank_no_chain(self):
         """Test IV rank with empty chain."""
@@ -147,6 +149,16 @@ class TestTickerScanner(unittest.TestCase):
         iv_rank = self.scanner._get_iv_rank("AAPL")
         self.assertEqual(iv_rank, 50.0)  # Neutral default
 
+    def test_option_chain_fetched_once_per_scan(self):
+        """Test IV rank and open interest share one chain fetch within a scan."""
+        self.mock_broker.get_option_chain = Mock(return_value=[{"implied_volatility": 0.3}])
+        self.scanner._scan_cache = {}
+
+        self.scanner._get_iv_rank("AAPL")
+        self.scanner._get_option_open_interest("AAPL")
+
+        self.mock_broker.get_option_chain.assert_called_once_with("AAPL")
+
     def test_get_option_open_interest(self):
         """Test option open interest calculation for 0-1 DTE."""
         now = datetime.utcnow()
@@ -171,14 +183,34 @@ class TestTickerScanner(unittest.TestCase):
                 "c": 99.0 + i,
             })
 
-        self.mock_broker.get_historical_bars = Mock(return_value=bars)
+        self.mock_broker.get_daily_bars = Mock(return_value=bars)
 
         atr = self.scanner._get_atr("AAPL", period=14)
         self.assertGreater(atr, 0.0)
 
+    def test_compute_metrics_fetches_daily_bars_once(self):
+        """Test gap and ATR are computed from a single daily-bar fetch."""
+        bars = [{"o": 100.0 + i, "h": 101.0 + i, "l": 99.0 + i, "c": 100.5 + i} for i in range(20)]
+        self.mock_broker.get_daily_bars = Mock(return_value=bars)
+        self.mock_broker.get_premarket_volume = Mock(return_value=0.0)
+        self.mock_broker.get_option_chain = Mock(return_value=[])
+        self.mock_broker.get_news = Mock(return_value=[])
+
+        self.scanner._compute_metrics("AAPL", datetime.now(pytz.UTC), {})
+
+        self.mock_broker.get_daily_bars.assert_called_once()
+
+    def test_keyword_sentiment_matches_whole_words(self):
+        """Test keywords only count as whole words."""
+        neutral = [{"headline": "Downtown store opens", "summary": "Shoppers line the sidewalk"}]
+        bullish = [{"headline": "Analyst upgrade after earnings beat", "summary": ""}]
+
+        self.assertEqual(self.scanner._analyze_sentiment_with_keywords(neutral), 0.0)
+        self.assertEqual(self.scanner._analyze_sentiment_with_keywords(bullish), 1.0)
+
     def test_get_atr_insufficient_bars(self):
         """Test ATR with insufficient data."""
-        self.mock_broker.get_historical_bars = Mock(return_value=[])
+        self.mock_broker.get_daily_bars = Mock(return_value=[])
 
         atr = self.scanner._get_atr("AAPL", period=14)
         self.assertEqual(atr, 0.0)
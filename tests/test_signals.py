@@ -6,7 +6,7 @@ import numpy as np
 import pandas as pd
 import pytz
 
-from signals import SignalDetector
+from signals import SignalDetector, ema_rsi
 
 
 class TestSignalDetector(unittest.TestCase):
@@ -86,6 +86,25 @@ class TestSignalDetector(unittest.TestCase):
         self.assertTrue((valid_rsi >= 0).all())
         self.assertTrue((valid_rsi <= 100).all())
 
+    def test_ema_rsi_matches_pandas(self):
+        """Test the array kernel matches the pandas ewm definitions."""
+        close = pd.Series([100, 101, 101, 100.5, 102, 103, 102.5, 102.5, 104] * 5, dtype=float)
+        delta = close.diff()
+        avg_gain = delta.clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+        avg_loss = (-delta.clip(upper=0)).ewm(alpha=1 / 14, adjust=False).mean()
+
+        ema_short, ema_long, rsi = ema_rsi(close.to_numpy(), 9, 21, 14)
+
+        np.testing.assert_allclose(ema_short, close.ewm(span=9, adjust=False).mean().to_numpy())
+        np.testing.assert_allclose(ema_long, close.ewm(span=21, adjust=False).mean().to_numpy())
+        np.testing.assert_allclose(rsi, (100 - 100 / (1 + avg_gain / avg_loss)).to_numpy())
+
+    def test_ema_rsi_flat_and_rising_series(self):
+        """Test RSI edge cases: no movement is undefined, only gains is 100."""
+        _, _, rsi = ema_rsi(np.array([5.0, 5.0, 5.0, 6.0]), 9, 21, 14)
+        self.assertTrue(np.isnan(rsi[:3]).all())
+        self.assertEqual(rsi[3], 100.0)
+
     def test_detect_crossover_bullish(self):
         """Test bullish EMA crossover detection."""
         previous = pd.Series({"diff": -0.5})
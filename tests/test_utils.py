@@ -3,17 +3,27 @@ import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytz
 
 from utils import (
+    FileCache,
+    TTLCache,
+    TradeLogBuffer,
+    TradeStats,
+    append_trade_log,
     chunk_list,
     eastern_now,
     ensure_timezone,
+    flush_trade_log,
     load_config,
     minutes_between,
     parse_time_range,
+    read_state,
     rolling_iv_rank,
+    save_config,
+    update_state,
     weighted_score,
     within_trading_windows,
 )
@@ -152,6 +162,104 @@ class TestUtils(unittest.TestCase):
         finally:
             Path(config_path).unlink()
 
+    def test_read_state_cached_copy(self):
+        """Test state reads are cached per file version and safe to mutate."""
+        with tempfile.TemporaryDirectory() as tmp:
+            state_file = Path(tmp) / "state.json"
+            with patch("utils.STATE_FILE", state_file):
+                self.assertEqual(read_state(), {})
+
+                update_state({"open_position": {"ticker": "SPY"}})
+                state = read_state()
+                state["open_position"]["ticker"] = "QQQ"
+                self.assertEqual(read_state()["open_position"]["ticker"], "SPY")
+
+                # External rewrite (different size) is picked up
+                state_file.write_text(json.dumps({"open_position": None, "paused": True}))
+                self.assertEqual(read_state(), {"open_position": None, "paused": True})
+
+    def test_trade_stats_incremental(self):
+        """Test trade stats fold in only newly appended rows."""
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "trades.csv"
+            log_path.write_text("timestamp,ticker,pnl_pct\n2024-01-15T10:00:00,SPY,10.0\n2024-01-15T11:00:00,SPY,-4.0\n")
+            stats = TradeStats(log_path)
+            stats.refresh()
+            snapshot = stats.snapshot()
+            self.assertEqual(snapshot["total_trades"], 2)
+            self.assertEqual(snapshot["win_rate"], 50.0)
+            self.assertAlmostEqual(snapshot["avg_pnl"], 3.0)
+
+            with log_path.open("a") as f:
+                f.write("2024-01-16T10:00:00,QQQ,2.0\n2024-01-16T11:00:00,QQQ,")
+            stats.refresh()
+            snapshot = stats.snapshot()
+            # Partially written last row is left for the next refresh
+            self.assertEqual(snapshot["total_trades"], 3)
+            self.assertEqual(snapshot["best_trade"], 10.0)
+            self.assertEqual(snapshot["worst_trade"], -4.0)
+            self.assertAlmostEqual(snapshot["avg_win"], 6.0)
+
+    def test_save_config_roundtrip(self):
+        """Test config is written atomically and reloads unchanged."""
+        config = {"mode": "paper", "watchlist": {"symbols": ["SPY", "QQQ"]}, "trading": {"max_risk_pct": 0.01}}
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "config.yaml"
+            save_config(config, str(config_path))
+            self.assertFalse((Path(tmp) / "config.yaml.tmp").exists())
+            self.assertEqual(load_config(str(config_path), force_reload=True), config)
+
+    def test_append_trade_log_header_once(self):
+        """Test trade rows are appended with a single header."""
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "trades.csv"
+            with patch("utils.TRADE_LOG_FILE", log_path):
+                append_trade_log({"timestamp": "2024-01-15T10:00:00-05:00", "ticker": "SPY", "pnl_pct": 5.0})
+                append_trade_log({"timestamp": "2024-01-15T11:00:00-05:00", "ticker": "QQQ", "pnl_pct": -2.0})
+                flush_trade_log()
+            lines = log_path.read_text().splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertTrue(lines[0].startswith("timestamp,ticker"))
+            self.assertTrue(lines[2].startswith("2024-01-15T11:00:00-05:00,QQQ"))
+
+    def test_trade_log_buffer_keeps_rows_on_write_error(self):
+        """Test rows survive a failed write of any kind and are written next time."""
+        buffer = TradeLogBuffer()
+        buffer._rows.extend([{"ticker": "SPY"}, {"ticker": "QQQ"}])
+
+        with patch("utils._write_trade_rows", side_effect=ValueError("bad row")):
+            with self.assertRaises(ValueError):
+                buffer.flush()
+        self.assertEqual([row["ticker"] for row in buffer._rows], ["SPY", "QQQ"])
+
+        with patch("utils._write_trade_rows") as mock_write:
+            buffer.flush()
+        mock_write.assert_called_once_with([{"ticker": "SPY"}, {"ticker": "QQQ"}])
+
+    def test_file_cache_ttl(self):
+        """Test file cache hits within TTL and expires after it."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = FileCache(Path(tmp) / "news", default_ttl=300)
+            self.assertIsNone(cache.get("SPY|1"))
+
+            cache.set("SPY|1", [{"headline": "SPY rallies"}])
+            self.assertEqual(cache.get("SPY|1"), [{"headline": "SPY rallies"}])
+
+            cache.set("QQQ|1", [], ttl=0)
+            self.assertIsNone(cache.get("QQQ|1"))
+
+    def test_ttl_cache_evicts_oldest(self):
+        """Test TTL cache bounds its size by evicting least recently used keys."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("SPY", 1)
+        cache.set("QQQ", 2)
+        self.assertEqual(cache.get("SPY"), 1)
+        cache.set("IWM", 3)
+
+        self.assertIsNone(cache.get("QQQ"))
+        self.assertEqual(cache.get("SPY"), 1)
+        self.assertEqual(cache.get("IWM"), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
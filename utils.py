@@ -1,7 +1,16 @@
+import atexit
+import copy
 import csv
+import hashlib
+import io
 import json
 import logging
 import logging.handlers
+import math
+import os
+import threading
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -9,12 +18,33 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 import pytz
 import yaml
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 LOG_DIR = BASE_DIR / "logs"
 STATE_FILE = DATA_DIR / "state.json"
 TRADE_LOG_FILE = DATA_DIR / "trades.csv"
+CACHE_DIR = DATA_DIR / "cache"
+TRADE_LOG_FIELDS = (
+    "timestamp",
+    "ticker",
+    "direction",
+    "strike",
+    "expiration",
+    "entry_price",
+    "exit_price",
+    "contracts",
+    "pnl_pct",
+    "exit_reason",
+)
 CONFIG_CACHE: Optional[Dict[str, Any]] = None
+# Parsed state.json keyed on (st_mtime_ns, st_size) so unchanged files are not re-parsed
+_STATE_CACHE: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+_STATE_LOCK = threading.Lock()
 EASTERN_TZ = pytz.timezone("US/Eastern")
 
 
@@ -49,6 +79,19 @@ def load_config(path: Optional[str] = None, force_reload: bool = False) -> Dict[
     return CONFIG_CACHE
 
 
+def save_config(config: Dict[str, Any], path: Optional[str] = None) -> None:
+    """Atomically write configuration back to YAML.
+
+    Uses the C-accelerated dumper when libyaml is available and swaps the file
+    in with ``os.replace`` so readers never see a partial config.
+    """
+    config_path = Path(path) if path else BASE_DIR / "config.yaml"
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        yaml.dump(config, f, Dumper=YamlDumper, default_flow_style=False)
+    os.replace(tmp_path, config_path)
+
+
 def setup_logging(config: Dict[str, Any]) -> None:
     """Configure logging based on config.yaml settings."""
     ensure_directories()
@@ -80,21 +123,46 @@ def setup_logging(config: Dict[str, Any]) -> None:
     logging.basicConfig(level=level_name, handlers=handlers, force=True)
 
 
-def read_state() -> Dict[str, Any]:
-    """Load runtime state from disk."""
-    ensure_directories()
-    if not STATE_FILE.exists():
+def _state_file_key() -> Optional[Tuple[int, int]]:
+    try:
+        stat = STATE_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_state(deep_copy: bool = True) -> Dict[str, Any]:
+    """Load runtime state from disk.
+
+    The parsed file is cached until its mtime or size changes; callers get a
+    deep copy so they can mutate the result freely. Read-only callers on hot
+    paths may pass ``deep_copy=False`` to get the shared cached dict instead.
+    """
+    global _STATE_CACHE
+
+    key = _state_file_key()
+    if key is None:
         return {}
 
-    with STATE_FILE.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    with _STATE_LOCK:
+        if _STATE_CACHE is None or _STATE_CACHE[0] != key:
+            with STATE_FILE.open("r", encoding="utf-8") as f:
+                _STATE_CACHE = (key, json.load(f))
+        state = _STATE_CACHE[1]
+    return copy.deepcopy(state) if deep_copy else state
 
 
 def write_state(state: Dict[str, Any]) -> None:
     """Persist runtime state to disk."""
+    global _STATE_CACHE
+
     ensure_directories()
-    with STATE_FILE.open("w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
+    with _STATE_LOCK:
+        with STATE_FILE.open("w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        # Prime the cache with what was just written
+        key = _state_file_key()
+        _STATE_CACHE = (key, copy.deepcopy(state)) if key is not None else None
 
 
 def update_state(updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -105,27 +173,250 @@ def update_state(updates: Dict[str, Any]) -> Dict[str, Any]:
     return state
 
 
-def append_trade_log(record: Dict[str, Any]) -> None:
-    """Append a trade record to the CSV trade log."""
+# Seconds the trade-log flusher waits between batched writes
+TRADE_LOG_FLUSH_INTERVAL_SECONDS = 0.1
+
+
+def _write_trade_rows(rows: List[Dict[str, Any]]) -> None:
+    """Append ``rows`` with one O_APPEND write and one fsync.
+
+    Writing the whole batch at once means tail readers of the log never observe
+    a half-written record.
+    """
     ensure_directories()
-    is_new_file = not TRADE_LOG_FILE.exists()
-
-    with TRADE_LOG_FILE.open("a", encoding="utf-8", newline="") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=[
-            "timestamp",
-            "ticker",
-            "direction",
-            "strike",
-            "expiration",
-            "entry_price",
-            "exit_price",
-            "contracts",
-            "pnl_pct",
-            "exit_reason",
-        ])
-        if is_new_file:
+    fd = os.open(TRADE_LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=TRADE_LOG_FIELDS)
+        if os.fstat(fd).st_size == 0:
             writer.writeheader()
-        writer.writerow(record)
+        writer.writerows(rows)
+        os.write(fd, buffer.getvalue().encode("utf-8"))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class TradeLogBuffer:
+    """Write-behind queue for trade-log rows.
+
+    ``append`` only queues the record; a daemon thread writes whatever has
+    accumulated every ``interval`` seconds, and ``flush`` (also run at exit)
+    writes immediately.
+    """
+
+    def __init__(self, interval: float = TRADE_LOG_FLUSH_INTERVAL_SECONDS) -> None:
+        self.interval = interval
+        self._rows: deque = deque()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self._rows.append(dict(record))
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="trade-log-writer", daemon=True)
+                self._thread.start()
+
+    def flush(self) -> None:
+        """Write every queued row now."""
+        with self._flush_lock:
+            rows = []
+            while self._rows:
+                rows.append(self._rows.popleft())
+            if not rows:
+                return
+            try:
+                _write_trade_rows(rows)
+            except BaseException:
+                # Whatever went wrong, keep the rows (in order) for the next attempt
+                self._rows.extendleft(reversed(rows))
+                raise
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception as exc:  # noqa: BLE001 - the writer thread must outlive bad rows
+                logging.getLogger(__name__).error("Failed to write trade log: %s", exc, exc_info=True)
+
+
+_TRADE_LOG_BUFFER = TradeLogBuffer()
+atexit.register(_TRADE_LOG_BUFFER.flush)
+
+
+def append_trade_log(record: Dict[str, Any]) -> None:
+    """Queue a trade record for the CSV trade log (written within ~100 ms)."""
+    _TRADE_LOG_BUFFER.append(record)
+
+
+def flush_trade_log() -> None:
+    """Write any queued trade records to the CSV trade log immediately."""
+    _TRADE_LOG_BUFFER.flush()
+
+
+class TradeStats:
+    """Running performance aggregates over the append-only trade log.
+
+    ``refresh()`` folds in only the rows appended since the previous call, so
+    serving ``snapshot()`` costs O(new trades) rather than a full re-read.
+    """
+
+    def __init__(self, path: Any = TRADE_LOG_FILE) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._offset = 0
+        self._pnl_idx: Optional[int] = None
+        self.total = 0
+        self.priced = 0
+        self.wins = 0
+        self.losses = 0
+        self.sum_pnl = 0.0
+        self.sum_win = 0.0
+        self.sum_loss = 0.0
+        self.best: Optional[float] = None
+        self.worst: Optional[float] = None
+
+    def add(self, pnl_pct: Optional[float]) -> None:
+        """Count one closed trade; a missing P/L counts as a trade but not in the P/L stats."""
+        self.total += 1
+        if pnl_pct is None:
+            return
+        self.priced += 1
+        self.sum_pnl += pnl_pct
+        if pnl_pct > 0:
+            self.wins += 1
+            self.sum_win += pnl_pct
+        elif pnl_pct < 0:
+            self.losses += 1
+            self.sum_loss += pnl_pct
+        self.best = pnl_pct if self.best is None else max(self.best, pnl_pct)
+        self.worst = pnl_pct if self.worst is None else min(self.worst, pnl_pct)
+
+    def refresh(self) -> None:
+        """Fold in complete rows appended to the log since the last refresh."""
+        with self._lock:
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                self._reset()
+                return
+            if size < self._offset:
+                # Log was replaced or truncated; rebuild from scratch
+                self._reset()
+            if size == self._offset:
+                return
+
+            with self.path.open("rb") as f:
+                f.seek(self._offset)
+                chunk = f.read()
+            end = chunk.rfind(b"\n") + 1
+            if not end:
+                return
+            for row in csv.reader(io.StringIO(chunk[:end].decode("utf-8"))):
+                if not row:
+                    continue
+                if self._pnl_idx is None:
+                    self._pnl_idx = row.index("pnl_pct")
+                    continue
+                try:
+                    pnl_pct: Optional[float] = float(row[self._pnl_idx])
+                except (ValueError, IndexError):
+                    pnl_pct = None
+                if pnl_pct is not None and math.isnan(pnl_pct):
+                    pnl_pct = None
+                self.add(pnl_pct)
+            self._offset += end
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Aggregates in the shape served by the dashboard's performance endpoint."""
+        if self.total == 0:
+            return {"total_trades": 0}
+        return {
+            "total_trades": self.total,
+            "wins": self.wins,
+            "losses": self.losses,
+            "win_rate": self.wins / self.total * 100,
+            "avg_win": self.sum_win / self.wins if self.wins else 0.0,
+            "avg_loss": self.sum_loss / self.losses if self.losses else 0.0,
+            "avg_pnl": self.sum_pnl / self.priced if self.priced else 0.0,
+            "total_pnl": self.sum_pnl,
+            "best_trade": self.best if self.best is not None else 0.0,
+            "worst_trade": self.worst if self.worst is not None else 0.0,
+        }
+
+
+class FileCache:
+    """JSON-file cache with a per-entry TTL, one file per key under ``directory``.
+
+    Entries survive restarts, so repeated fetches within the TTL are served from
+    disk instead of the network.
+    """
+
+    def __init__(self, directory: Any, default_ttl: float = 300.0) -> None:
+        self.directory = Path(directory)
+        self.default_ttl = default_ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.md5(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        try:
+            with self._path(key).open("r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("fetched_at", 0) >= entry.get("ttl", self.default_ttl):
+            return None
+        return entry.get("data")
+
+    def set(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """Store ``data`` under ``key``; written atomically so readers never see partial JSON."""
+        entry = {"data": data, "fetched_at": time.time(), "ttl": self.default_ttl if ttl is None else ttl}
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logging.getLogger(__name__).warning("Failed to write cache entry %s: %s", path, exc)
+
+
+class TTLCache:
+    """Thread-safe in-memory LRU with a fixed TTL; the oldest entry is evicted past ``maxsize``."""
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the value for ``key`` if stored less than ``ttl`` seconds ago."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
 
 
 def parse_time_range(range_str: str) -> Tuple[int, int]: